@@ -1,10 +1,87 @@
-WIDTH, HEIGHT = 1280, 720
+WIDTH, HEIGHT = 1280, 720  # logical render size
 FPS = 60
 
+# "scaled": render at WIDTH x HEIGHT, SDL scales it to any window size
+# "native": render at window size and re-lay out the UI on resize
+WINDOW_MODE = "scaled"
+FULLSCREEN = False  # F11 toggles
+
+# None: pygame's bundled default font (no system font scan at startup),
+# or the path of a .ttf to ship in assets/
+FONT_PATH = None
+STARTUP_REPORT = True  # print the startup timing breakdown after the first frame
+ATLAS_PATH = "assets/atlas.bin"  # prebuilt sprite atlas, rebuilt when stale
+
+# adaptive quality: shed cosmetic work when frames run over budget
+ADAPTIVE_QUALITY = True
+QUALITY_DROP_RATIO = 0.9  # work time above this share of the frame budget...
+QUALITY_DROP_FRAMES = 30  # ...for this many frames in a row drops one level
+QUALITY_RESTORE_RATIO = 0.6  # below this share of the budget...
+QUALITY_RESTORE_FRAMES = 180  # ...for this many frames restores one level
+
+# prepare HUD text / enemy HP bars on a helper thread while the
+# background is being blitted (see core.render_prep)
+RENDER_PREP_THREAD = False
+
+# live metrics at http://TELEMETRY_HOST:TELEMETRY_PORT/metrics
+TELEMETRY_ENABLED = False
+TELEMETRY_HOST = "127.0.0.1"  # local only
+TELEMETRY_PORT = 9464
+
+# frame capture (F8 toggles recording)
+CAPTURE_DIR = "captures"
+CAPTURE_FORMAT = "png"  # "png" sequence or "raw" RGB24 stream
+CAPTURE_QUEUE_SIZE = 8  # frames waiting for the writer; more are dropped
+CAPTURE_EVERY_N_FRAMES = 1
+
+# soak / stress mode (python src/main.py --soak SECONDS)
+SOAK_SAMPLE_EVERY = 10.0  # wall-clock seconds between samples
+SOAK_WARMUP_SAMPLES = 2  # samples ignored before the baseline
+SOAK_MAX_MEMORY_GROWTH_MB = 20.0
+SOAK_MAX_TICK_GROWTH = 1.5  # allowed tick time ratio vs baseline
+SOAK_MAX_LEAKED_OBJECTS = 200  # per type, alive but not held by the game
+SOAK_MAX_WAVE = 15  # waves cycle back to 1 after this
+
+SAVE_PATH = "savegame.bin"  # F5 saves, F9 loads
+COMBAT_STATS_CSV = "combat_stats.csv"  # per-wave defence stats, None to disable
+
+# optional defence stat overrides, reloaded while the game runs (see core.balance)
+BALANCE_FILE = "balance.json"
+BALANCE_POLL_INTERVAL = 0.5  # seconds between checks of the file's mtime
+
 BOTTOM_FRACTION = 1 / 4  # bottom quarter is castle
 ENEMY_SIZE = 40
+ENEMY_SPRITE_SIZE = (28, 28)  # drawn goblin size (walk frames squash around it)
+ENEMY_ANIM_FPS = 8  # walk cycle frames per second
 BASE_ENEMY_SPEED = 40
 
+# crowd separation (enemies push each other apart instead of stacking)
+ENEMY_SEPARATION_RADIUS = 26  # px, roughly the drawn enemy size
+ENEMY_SEPARATION_MAX_NEIGHBOURS = 6  # cap per enemy per tick
+ENEMY_SEPARATION_STRENGTH = 0.5  # fraction of the overlap resolved per tick
+
+# enemy level of detail (by number of live enemies)
+LOD_HP_BAR_THRESHOLD = 150  # above: full-health enemies skip their HP bar
+LOD_POINT_THRESHOLD = 600  # above: enemies are drawn as dots
+LOD_CLUSTER_THRESHOLD = 1500  # above: far-off enemies are merged per cell
+LOD_CLUSTER_CELL = 48  # px
+LOD_FAR_FRACTION = 0.5  # top share of the playfield that counts as far off
+
+# defence slots: up to SLOT_ROW_MAX sit in one row, more become a grid
+SLOT_COUNT = 5
+SLOT_ROW_MAX = 5
+SLOT_GRID_MIN_SIZE = 24  # px, grid slots never shrink below this
+
+# defence targeting (see core.targeting)
+TARGET_GRID_CELL = 100  # px, grid used for range queries
+DEFENCE_GRID_CELL = 64  # px, grid enemies use to find their nearest defence
+TARGET_CLUSTER_RADIUS = 60  # px, roughly the mage AoE radius
+LEAD_TARGETS = True  # aim where the enemy will be when the shot lands
+
+# damage numbers: hits on one enemy within the window merge into one number
+DAMAGE_NUMBER_MERGE_WINDOW = 0.25  # seconds
+DAMAGE_NUMBER_MAX = 60  # oldest numbers are dropped beyond this
+
 GOLD_PER_KILL = 10
 GOLD_PER_WAVE_CLEAR = 20
 
@@ -20,6 +97,7 @@ DEFENCE_STATS = {
         "crit_multiplier": 2.0,
         "shop_cost": 40,
         "max_hp": 50,
+        "targeting": "first",
     },
     "cannon": {
         "damage": 25,
@@ -32,6 +110,8 @@ DEFENCE_STATS = {
         "crit_multiplier": 2.0,
         "shop_cost": 80,
         "max_hp": 50,
+        "targeting": "strongest",
+        "stun_duration": 0.4,
     },
     "mage": {
         "damage": 12,
@@ -44,7 +124,45 @@ DEFENCE_STATS = {
         "crit_multiplier": 2.0,
         "shop_cost": 100,
         "max_hp": 50,
+        "targeting": "clustered",
+        "slow_factor": 0.6,
+        "slow_duration": 1.5,
+        "burn_dps": 4.0,
+        "burn_duration": 2.0,
+    },
+    # instant-hit kinds ("attack" other than "projectile", see core.hitscan)
+    "lightning": {
+        "attack": "chain",
+        "damage": 10,
+        "range": 260,
+        "cooldown": 0.9,
+        "proj_speed": 0,
+        "color": (140, 210, 255),
+        "base_cost": 60,
+        "crit_chance": 0.10,
+        "crit_multiplier": 2.0,
+        "shop_cost": 120,
+        "max_hp": 50,
+        "targeting": "clustered",
+        "chain_count": 4,  # extra jumps after the first hit
+        "chain_range": 90,  # px between chained enemies
+        "chain_falloff": 0.75,  # damage multiplier per jump
+    },
+    "laser": {
+        "attack": "beam",
+        "damage": 5,
+        "range": 320,
+        "cooldown": 0.25,
+        "proj_speed": 0,
+        "color": (255, 70, 70),
+        "base_cost": 70,
+        "crit_chance": 0.05,
+        "crit_multiplier": 2.0,
+        "shop_cost": 140,
+        "max_hp": 50,
+        "targeting": "first",
+        "beam_width": 8,  # px
     },
 }
 
-DEFENCE_TYPES = ["archer", "cannon", "mage"]
+DEFENCE_TYPES = ["archer", "cannon", "mage", "lightning", "laser"]
@@ -0,0 +1,82 @@
+# src/core/aiming.py
+from dataclasses import dataclass
+
+
+def intercept_time(dx: float, dy: float, vx: float, vy: float, speed: float):
+    """
+    Earliest time t > 0 at which a shot of ``speed`` fired now meets a target
+    at offset (dx, dy) moving with constant velocity (vx, vy), or None.
+
+    Solves |D + V*t| = speed * t, i.e.
+        (V.V - s^2) t^2 + 2 (D.V) t + D.D = 0
+    """
+    a = vx * vx + vy * vy - speed * speed
+    b = 2.0 * (dx * vx + dy * vy)
+    c = dx * dx + dy * dy
+
+    if abs(a) < 1e-6:
+        # target as fast as the shot: linear equation
+        if b >= 0:
+            return None
+        return -c / b
+
+    disc = b * b - 4.0 * a * c
+    if disc < 0:
+        return None
+
+    root = disc**0.5
+    t1 = (-b - root) / (2.0 * a)
+    t2 = (-b + root) / (2.0 * a)
+    t = min(t1, t2)
+    if t <= 0:
+        t = max(t1, t2)
+    return t if t > 0 else None
+
+
+def aim_shots(shots, lead: bool = True):
+    """
+    Fire every queued (defence, target) shot of this tick in one pass.
+
+    With ``lead`` each shot is aimed at where its target will be when the
+    projectile arrives (closed-form intercept); shots with no solution, or
+    when ``lead`` is off, go straight at the target's current position.
+    Returns the projectiles fired.
+    """
+    fired = []
+    for defence, target in shots:
+        px, py = defence.pos.x, defence.pos.y
+        dx = target.pos.x - px
+        dy = target.pos.y - py
+
+        if lead:
+            vel = target.velocity
+            t = intercept_time(dx, dy, vel.x, vel.y, defence.base_projectile_speed)
+            if t is not None:
+                dx += vel.x * t
+                dy += vel.y * t
+
+        projectile = defence.fire(dx, dy)
+        if projectile is not None:
+            fired.append(projectile)
+    return fired
+
+
+@dataclass
+class ShotStats:
+    """Running hit / miss counts for projectiles that have finished."""
+
+    hits: int = 0
+    misses: int = 0
+    wasted_ticks: int = 0  # ticks spent in flight by projectiles that missed
+
+    def record(self, projectile):
+        if projectile.hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.wasted_ticks += projectile.ticks
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
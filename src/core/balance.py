@@ -0,0 +1,272 @@
+# src/core/balance.py
+"""
+Hot-reloadable defence stats.
+
+``config.DEFENCE_STATS`` stays the source of the defaults. An optional
+data file (``BALANCE_FILE``, JSON, or TOML on Python 3.11+) overrides any
+of its values per defence type, e.g.
+
+    {"archer": {"damage": 10, "cooldown": 0.35}}
+
+A daemon thread polls the file's mtime, parses it and builds a complete new
+set of ``DefenceSpec`` tables off the main thread. The game thread picks the
+finished tables up with ``take()`` once per tick and swaps them in as a
+whole, so nothing ever sees half a reload. Defences copy their numbers out
+of their spec, the per-tick code never looks into the stats dicts.
+
+Values are checked and converted (``STAT_TYPES``) before anything is
+swapped in: an unknown key or a value of the wrong type fails the reload
+and the game keeps the numbers it has.
+"""
+
+import copy
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+
+from config import DEFENCE_STATS
+from core.targeting import TARGETING_POLICIES
+from entities.status_effects import OnHitEffects
+
+ATTACK_KINDS = ("projectile", "chain", "beam")
+
+
+def _number(value) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    number = float(value)
+    if not math.isfinite(number) or number < 0:
+        raise ValueError(f"expected a number >= 0, got {value!r}")
+    return number
+
+
+def _count(value) -> int:
+    number = _number(value)
+    if number != int(number):
+        raise ValueError(f"expected a whole number, got {value!r}")
+    return int(number)
+
+
+def _color(value) -> tuple:
+    if isinstance(value, str) or len(value) != 3:
+        raise ValueError(f"expected [r, g, b], got {value!r}")
+    color = tuple(_count(c) for c in value)
+    if max(color) > 255:
+        raise ValueError(f"color channels go up to 255, got {value!r}")
+    return color
+
+
+def _one_of(choices):
+    def check(value) -> str:
+        if value not in choices:
+            raise ValueError(f"expected one of {', '.join(choices)}, got {value!r}")
+        return value
+
+    return check
+
+
+# every stat a defence type may set, with the converter that checks it
+STAT_TYPES = {
+    "damage": _number,
+    "range": _number,
+    "cooldown": _number,
+    "proj_speed": _number,
+    "color": _color,
+    "base_cost": _count,
+    "shop_cost": _count,
+    "crit_chance": _number,
+    "crit_multiplier": _number,
+    "max_hp": _number,
+    "targeting": _one_of(TARGETING_POLICIES),
+    "attack": _one_of(ATTACK_KINDS),
+    "chain_count": _count,
+    "chain_range": _number,
+    "chain_falloff": _number,
+    "beam_width": _number,
+    "slow_factor": _number,
+    "slow_duration": _number,
+    "burn_dps": _number,
+    "burn_duration": _number,
+    "stun_duration": _number,
+}
+
+
+def check_stat(dtype: str, key: str, value):
+    """``value`` converted to the stat's type; ValueError naming the stat if it can't be."""
+    convert = STAT_TYPES.get(key)
+    if convert is None:
+        raise ValueError(f"{dtype}: unknown stat {key!r}")
+    try:
+        return convert(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{dtype}.{key}: {exc}") from None
+
+
+@dataclass(frozen=True)
+class DefenceSpec:
+    """Everything a Defence reads from its stats, resolved once per reload."""
+
+    damage: float
+    range: float
+    cooldown: float
+    proj_speed: float
+    color: tuple
+    base_cost: int
+    crit_chance: float
+    crit_multiplier: float
+    max_hp: float
+    targeting: str
+    attack: str
+    chain_count: int
+    chain_range: float
+    chain_falloff: float
+    beam_width: float
+    on_hit: OnHitEffects | None
+
+    @classmethod
+    def from_stats(cls, stats: dict, dtype: str = "defence") -> "DefenceSpec":
+        def stat(key, default=None):
+            if default is None and key not in stats:
+                raise ValueError(f"{dtype}: missing stat {key!r}")
+            return check_stat(dtype, key, stats.get(key, default))
+
+        return cls(
+            damage=stat("damage"),
+            range=stat("range"),
+            cooldown=stat("cooldown"),
+            proj_speed=stat("proj_speed"),
+            color=stat("color"),
+            base_cost=stat("base_cost"),
+            crit_chance=stat("crit_chance"),
+            crit_multiplier=stat("crit_multiplier"),
+            max_hp=stat("max_hp", 50),
+            targeting=stat("targeting", "first"),
+            attack=stat("attack", "projectile"),
+            chain_count=stat("chain_count", 0),
+            chain_range=stat("chain_range", 0),
+            chain_falloff=stat("chain_falloff", 1.0),
+            beam_width=stat("beam_width", 0),
+            on_hit=OnHitEffects.from_stats(stats),
+        )
+
+
+def build_specs(stats_table: dict) -> dict[str, DefenceSpec]:
+    return {
+        dtype: DefenceSpec.from_stats(stats, dtype)
+        for dtype, stats in stats_table.items()
+    }
+
+
+# current tables; replaced as a whole by apply_tables(), never edited
+SPECS: dict[str, DefenceSpec] = build_specs(DEFENCE_STATS)
+# config's numbers as shipped; apply_tables() replaces the live entries, so
+# every reload merges onto this copy (a stat removed from the file reverts)
+_DEFAULT_STATS: dict = copy.deepcopy(DEFENCE_STATS)
+
+
+def get_spec(defence_type: str) -> DefenceSpec:
+    return SPECS[defence_type]
+
+
+def merge_overrides(overrides: dict) -> dict:
+    """Defaults from config with the file's values on top (new dicts, config untouched)."""
+    if not isinstance(overrides, dict):
+        raise ValueError("balance file must be a table of defence types")
+    merged = {dtype: dict(stats) for dtype, stats in _DEFAULT_STATS.items()}
+    for dtype, values in overrides.items():
+        if dtype not in merged:
+            raise ValueError(f"unknown defence type {dtype!r}")
+        if not isinstance(values, dict):
+            raise ValueError(f"{dtype}: expected a table of stats")
+        for key, value in values.items():
+            merged[dtype][key] = check_stat(dtype, key, value)
+    return merged
+
+
+def load_overrides(path: str) -> dict:
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11: JSON only
+            raise ValueError("TOML balance files need Python 3.11+") from None
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def apply_tables(stats_table: dict, specs: dict[str, DefenceSpec]):
+    """
+    Game thread only: make a reload current.
+
+    Entries of ``config.DEFENCE_STATS`` are replaced (not edited) so code
+    that still reads it, like the shop and popup, sees the new values too.
+    """
+    global SPECS
+    for dtype, stats in stats_table.items():
+        DEFENCE_STATS[dtype] = stats
+    SPECS = specs
+
+
+class BalanceReloader:
+    def __init__(self, path: str, interval: float = 0.5):
+        self.path = path
+        self.interval = interval
+        self.mtime: float | None = None
+        # (stats table, specs) waiting for the game thread
+        self.pending: tuple[dict, dict[str, DefenceSpec]] | None = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    # ---------- GAME THREAD ----------
+    def start(self):
+        # pick up a file that is already there before the first frame
+        self.check()
+        self.thread = threading.Thread(
+            target=self.run, name="balance-reload", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def take(self):
+        """The reloaded tables if a new set is ready, else None."""
+        if self.pending is None:  # cheap check without the lock
+            return None
+        with self.lock:
+            tables, self.pending = self.pending, None
+        return tables
+
+    # ---------- WATCHER THREAD ----------
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def check(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return
+        if mtime == self.mtime:
+            return
+        self.mtime = mtime
+
+        try:
+            stats_table = merge_overrides(load_overrides(self.path))
+            specs = build_specs(stats_table)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            # keep playing with the old numbers until the file is fixed
+            print(f"Balance reload failed ({self.path}):", exc)
+            return
+
+        with self.lock:
+            # a newer set replaces one the game hasn't taken yet
+            self.pending = (stats_table, specs)
+        print("Balance reloaded from", self.path)
@@ -0,0 +1,156 @@
+# src/core/capture.py
+"""
+Frame capture: NumPy views of rendered frames and a background recorder.
+
+Frame arrays need numpy (``pygame.surfarray``); the recorder itself only
+uses pygame.
+"""
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+import pygame
+
+from config import CAPTURE_EVERY_N_FRAMES, CAPTURE_FORMAT, CAPTURE_QUEUE_SIZE
+
+STOP_TIMEOUT = 5.0  # s stop() waits for the writer to flush
+
+
+@contextmanager
+def frame_pixels(surface: pygame.Surface):
+    """
+    Zero-copy (width, height, 3) uint8 view of ``surface``.
+
+    The surface stays locked while the view exists, so only use it inside
+    the ``with`` block (copy the array if you need to keep it).
+    """
+    try:
+        import pygame.surfarray as surfarray
+
+        view = surfarray.pixels3d(surface)
+    except (ImportError, NotImplementedError) as exc:
+        raise ImportError("frame capture to arrays needs numpy installed") from exc
+
+    try:
+        yield view
+    finally:
+        del view
+
+
+def save_thumbnail(surface: pygame.Surface, path: str, width: int = 320):
+    height = max(1, surface.get_height() * width // surface.get_width())
+    thumb = pygame.transform.smoothscale(surface, (width, height))
+    pygame.image.save(thumb, path)
+
+
+class FrameRecorder:
+    """
+    Streams frames to disk on a writer thread.
+
+    ``submit`` only copies the frame (a fast C blit) and puts it on a
+    bounded queue. If the writer falls behind and the queue is full the
+    frame is dropped and counted, so recording never stalls the game.
+    A failed write (disk full, bad path) is kept in ``error``; the writer
+    then just drains the queue, so ``stop`` never waits on a dead thread.
+
+    Formats:
+        "png": out_dir/frame_000000.png, ...
+        "raw": out_dir/frames.rgb (packed RGB24, frames back to back) plus
+               out_dir/frames.txt with "width height fps"
+    """
+
+    def __init__(
+        self,
+        out_dir: str,
+        fmt: str = CAPTURE_FORMAT,
+        fps: int = 60,
+        max_queue: int = CAPTURE_QUEUE_SIZE,
+        every_n_frames: int = CAPTURE_EVERY_N_FRAMES,
+    ):
+        if fmt not in ("png", "raw"):
+            raise ValueError(f"unknown capture format {fmt!r}")
+
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.fps = fps
+        self.every_n_frames = max(1, every_n_frames)
+
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.thread: threading.Thread | None = None
+        self.raw_file = None
+
+        self.frame_counter = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0  # frames the writer couldn't write (writer thread only)
+        self.error: Exception | None = None
+
+    def start(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.thread = threading.Thread(
+            target=self._writer, name="frame-recorder", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, surface: pygame.Surface):
+        self.frame_counter += 1
+        if (self.frame_counter - 1) % self.every_n_frames:
+            return
+
+        try:
+            self.queue.put_nowait(surface.copy())
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self):
+        """Flush queued frames and close files."""
+        if self.thread is None:
+            return
+        if self.thread.is_alive():
+            try:
+                self.queue.put(None, timeout=STOP_TIMEOUT)
+            except queue.Full:
+                print("Frame recorder not draining, giving up on queued frames")
+        self.thread.join(timeout=STOP_TIMEOUT)
+        self.thread = None
+
+    def _writer(self):
+        index = 0
+        try:
+            while True:
+                frame = self.queue.get()
+                if frame is None:
+                    break
+
+                if self.error is not None:
+                    self.failed += 1
+                    continue
+
+                try:
+                    if self.fmt == "png":
+                        path = os.path.join(self.out_dir, f"frame_{index:06d}.png")
+                        pygame.image.save(frame, path)
+                    else:
+                        if self.raw_file is None:
+                            self._open_raw(frame.get_size())
+                        self.raw_file.write(pygame.image.tobytes(frame, "RGB"))
+                except (OSError, pygame.error) as exc:
+                    # keep draining so submit() and stop() never block
+                    self.error = exc
+                    self.failed += 1
+                    print("Frame recording failed:", exc)
+                    continue
+
+                index += 1
+                self.written = index
+        finally:
+            if self.raw_file is not None:
+                self.raw_file.close()
+                self.raw_file = None
+
+    def _open_raw(self, size: tuple[int, int]):
+        with open(os.path.join(self.out_dir, "frames.txt"), "w") as f:
+            f.write(f"{size[0]} {size[1]} {self.fps}\n")
+        self.raw_file = open(os.path.join(self.out_dir, "frames.rgb"), "wb")
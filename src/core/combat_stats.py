@@ -0,0 +1,118 @@
+# src/core/combat_stats.py
+import csv
+import os
+from dataclasses import dataclass, fields, replace
+
+
+@dataclass
+class DefenceStats:
+    """
+    Running combat counters of one defence.
+
+    Bumped in place where things happen (firing, hits, the CombatLedger),
+    so keeping them costs a few additions per event.
+    """
+
+    shots: int = 0
+    hits: int = 0  # enemies damaged by a direct hit (AoE / chains count each)
+    crits: int = 0
+    damage: float = 0.0  # effective damage, overkill not included
+    kills: int = 0
+    overkill: float = 0.0  # damage past the killing blow
+    gold: int = 0  # kill gold earned
+    time: float = 0.0  # seconds in play, for DPS
+
+    @property
+    def dps(self) -> float:
+        return self.damage / self.time if self.time > 0 else 0.0
+
+    def copy(self) -> "DefenceStats":
+        return replace(self)
+
+    def minus(self, other: "DefenceStats") -> "DefenceStats":
+        return DefenceStats(
+            **{
+                f.name: getattr(self, f.name) - getattr(other, f.name)
+                for f in fields(self)
+            }
+        )
+
+
+CSV_FIELDS = [
+    "wave",
+    "slot",
+    "type",
+    "level",
+    "shots",
+    "hits",
+    "crits",
+    "damage",
+    "kills",
+    "overkill",
+    "gold",
+    "dps",
+]
+
+
+class WaveStatsLog:
+    """
+    Per-wave combat stats of every slotted defence.
+
+    ``begin_wave`` snapshots the counters, ``end_wave`` turns the difference
+    into one row per defence and appends them to ``path`` as CSV (if set).
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.wave: int | None = None
+        self.start: dict = {}  # defence -> DefenceStats at wave start
+        self.rows: list[dict] = []  # rows of the last finished wave
+
+    def begin_wave(self, wave: int, slot_defences):
+        self.wave = wave
+        self.start = {d: d.stats.copy() for d in slot_defences if d is not None}
+
+    def end_wave(self, slot_defences) -> list[dict]:
+        if self.wave is None:
+            return []
+
+        rows = []
+        for slot, defence in enumerate(slot_defences):
+            if defence is None:
+                continue
+            start = self.start.get(defence)
+            delta = defence.stats.minus(start) if start is not None else defence.stats
+            rows.append(
+                {
+                    "wave": self.wave,
+                    "slot": slot + 1,
+                    "type": defence.defence_type,
+                    "level": defence.level,
+                    "shots": delta.shots,
+                    "hits": delta.hits,
+                    "crits": delta.crits,
+                    "damage": round(delta.damage, 1),
+                    "kills": delta.kills,
+                    "overkill": round(delta.overkill, 1),
+                    "gold": delta.gold,
+                    "dps": round(delta.dps, 2),
+                }
+            )
+
+        self.rows = rows
+        self.wave = None
+        self.start = {}
+        if self.path is not None and rows:
+            self.write(rows)
+        return rows
+
+    def write(self, rows: list[dict]):
+        new_file = not os.path.exists(self.path)
+        try:
+            with open(self.path, "a", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                if new_file:
+                    writer.writeheader()
+                writer.writerows(rows)
+        except OSError as exc:
+            print("Could not write combat stats:", exc)
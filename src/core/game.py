@@ -1,13 +1,21 @@
 # src/core/game.py
+import os
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
 import pygame
 from pygame.time import wait
 
 import ui.action_bar
 from entities.aoe_effect import AoeEffect
+from entities.beam_effect import BeamEffect
 from config import (
     WIDTH,
     HEIGHT,
     FPS,
+    WINDOW_MODE,
+    FULLSCREEN,
     BOTTOM_FRACTION,
     DEFENCE_STATS,
     DEFENCE_TYPES,
@@ -15,15 +23,52 @@ from config import (
     ENEMY_SIZE,
     GOLD_PER_KILL,
     GOLD_PER_WAVE_CLEAR,
+    SAVE_PATH,
+    COMBAT_STATS_CSV,
+    BALANCE_FILE,
+    BALANCE_POLL_INTERVAL,
+    CAPTURE_DIR,
+    RENDER_PREP_THREAD,
+    TELEMETRY_ENABLED,
+    TELEMETRY_HOST,
+    TELEMETRY_PORT,
+    ADAPTIVE_QUALITY,
+    DEFENCE_GRID_CELL,
+    ENEMY_SEPARATION_RADIUS,
+    ENEMY_SEPARATION_MAX_NEIGHBOURS,
+    ENEMY_SEPARATION_STRENGTH,
+    LEAD_TARGETS,
+    SLOT_COUNT,
+    SLOT_ROW_MAX,
+    FONT_PATH,
+    STARTUP_REPORT,
+    ATLAS_PATH,
 )
+from core.spatial_grid import SpatialGrid
+from core.targeting import TARGETING_POLICIES, TargetIndex
+from core.aiming import ShotStats, aim_shots
+from core.hitscan import resolve_instant_shots
+from core.ledger import CombatLedger
+from core.combat_stats import WaveStatsLog
+from core.balance import BalanceReloader, apply_tables, get_spec
+from core.capture import FrameRecorder, frame_pixels, save_thumbnail
+from core.profiler import FrameProfiler, StartupTimer
+from core.render_prep import RenderPrep, RenderSnapshot
+from core.quality import QualityController
+from core.save_state import save_game, load_game
+from ui.input_router import HitLayer, InputRouter
 from entities.enemy import Enemy
 from entities.defence import Defence
 from entities.projectile import Projectile
-from entities.damage_number import DamageNumber
-
+from entities.damage_number import DamageNumbers
+from entities.status_effects import StatusEffects
+
+from ui.assets import cache_stats, get_overlay, install_atlas, load_sprite
+from ui.atlas import load_or_build_atlas
+from ui.enemy_lod import draw_enemies
+from ui.enemy_sprites import advance_animations, load_enemy_sprites
+from ui.layout import Layout, LayoutModel
 from ui.slots import (
-    compute_slot_rects,
-    get_slot_index_at_pos,
     draw_slots as draw_slots_ui,
     draw_slot_spots,
 )
@@ -32,6 +77,8 @@ from ui.hud import (
     draw_castle_hp,
     draw_damage_numbers,
     draw_game_overlay,
+    draw_profiler,
+    get_digit_atlas,
 )
 from ui.shop import draw_shop_popup, get_shop_popup_layout
 from ui.defence_popup import (
@@ -40,23 +87,93 @@ from ui.defence_popup import (
     calculate_defence_snapshot,
 )
 
+if TYPE_CHECKING:
+    from core.telemetry import Telemetry
+    from core.what_if import WhatIfPlanner
+
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("CastleDefend0r")
+    def __init__(
+        self,
+        headless: bool = False,
+        startup: StartupTimer | None = None,
+        telemetry: bool | None = None,
+    ):
+        # headless: no window, draw() renders into an offscreen surface
+        # telemetry: serve /metrics; None = TELEMETRY_ENABLED for windowed games
+        self.headless = headless
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        # startup: timer started by main() before the imports, if any
+        self.startup: StartupTimer | None = startup or StartupTimer()
+        self.startup_ms = 0.0
+
+        # only the subsystems the game uses (no audio / joystick start-up)
+        pygame.display.init()
+        pygame.font.init()
+        self.startup.mark("pygame init")
+
+        self.fullscreen = FULLSCREEN
+        if headless:
+            # a display mode is still needed for convert(); render elsewhere
+            pygame.display.set_mode((1, 1))
+            self.screen = pygame.Surface((WIDTH, HEIGHT)).convert()
+        else:
+            self.screen = self.create_window((WIDTH, HEIGHT))
+            pygame.display.set_caption("CastleDefend0r")
+        self.startup.mark("window")
+
+        # every sprite in one prebuilt file (rebuilt from the PNGs when stale)
+        install_atlas(load_or_build_atlas(ATLAS_PATH))
+        # every enemy direction / tint / walk frame, baked once
+        load_enemy_sprites()
+        self.startup.mark("atlas")
 
         self.clock = pygame.time.Clock()
         self.running = True
 
-        self.font = pygame.font.SysFont(None, 24)
-        self.big_font = pygame.font.SysFont(None, 72)
-        self.slot_labels = ["slot_1", "slot_2", "slot_3", "slot_4", "slot_5"]
+        self.profiler = FrameProfiler()
+        self.recorder: FrameRecorder | None = None
+
+        # optional helper thread for HUD text / HP bars (see core.render_prep)
+        self.render_prep = RenderPrep() if RENDER_PREP_THREAD else None
+        self.pending_prep = None
+
+        self.telemetry: "Telemetry | None" = None
+        if telemetry is None:
+            telemetry = TELEMETRY_ENABLED and not headless
+        if telemetry:
+            self.start_telemetry(TELEMETRY_HOST, TELEMETRY_PORT)
+
+        # balance file watcher; headless games keep the numbers they started with
+        self.balance: BalanceReloader | None = None
+        if BALANCE_FILE and not headless:
+            self.balance = BalanceReloader(BALANCE_FILE, BALANCE_POLL_INTERVAL)
+            self.balance.start()
+        self.quality = QualityController(FPS, enabled=ADAPTIVE_QUALITY)
+
+        # a font file, not a system font lookup (FONT_PATH None: pygame's own)
+        self.font = pygame.font.Font(FONT_PATH, 24)
+        self.big_font = pygame.font.Font(FONT_PATH, 72)
+        self.slot_labels = [f"slot_{i + 1}" for i in range(SLOT_COUNT)]
+
+        # screen geometry, recomputed only on resize
+        self.layout_model = LayoutModel(self.screen.get_size(), len(self.slot_labels))
 
         # wave / enemies
         self.enemies: list[Enemy] = []
         self.wave_number = 0
+        # kills / damage reported by enemies as they happen
+        self.ledger = CombatLedger()
+        # per-wave defence stats (headless games don't write the CSV)
+        self.wave_stats = WaveStatsLog(None if headless else COMBAT_STATS_CSV)
+        self.enemy_grid = SpatialGrid(ENEMY_SEPARATION_RADIUS)
+        # living defences, rebuilt once per tick for enemy steering
+        self.defence_grid = SpatialGrid(DEFENCE_GRID_CELL)
+        self.target_rect = pygame.Rect(0, 0, 10, 10)
+        self.target_index = TargetIndex()
 
         # castle hp
         self.castle_max_hp = 100.0
@@ -71,6 +188,7 @@ class Game:
         # defence
         self.defences: list[Defence] = []
         self.projectiles: list[Projectile] = []
+        self.shot_stats = ShotStats()  # hit rate of finished projectiles
 
         self.slot_defences: list[Defence | None] = [None] * len(self.slot_labels)
 
@@ -79,22 +197,13 @@ class Game:
         self.defence_popup_slot: int | None = None
         self.defence_popup_layout = None
 
-        self.fields_bg = pygame.image.load("assets/fields.png").convert()
-        self.castle_wall_img = pygame.image.load(
-            "assets/castle_wall_img.png"
-        ).convert_alpha()
+        self.fields_bg = load_sprite("assets/fields.png", alpha=False)
+        self.castle_wall_img = load_sprite("assets/castle_wall_img.png")
 
-        # compute playfield height once
-        castle_rect = self.get_castle_rect()
-
-        playfield_height = castle_rect.top
-        self.fields_bg_scaled = pygame.transform.smoothscale(
-            self.fields_bg, (WIDTH, playfield_height)
-        )
         self.init_defence()
 
         self.gold = 200
-        self.damage_numbers: list[DamageNumber] = []
+        self.damage_numbers = DamageNumbers()
 
         self.owned_defences: list[tuple[str, int]] = []
 
@@ -106,19 +215,19 @@ class Game:
 
         self.action_bar = ui.action_bar.ActionBar(self.screen, self.font)
         self.aoe_effects: list[AoeEffect] = []
+        self.beam_effects: list[BeamEffect] = []
+        self.status_effects = StatusEffects()
+        self.what_if: "WhatIfPlanner | None" = None
 
-    def get_nearest_defence(self, enemy) -> Defence | None:
-        living_defences = [d for d in self.defences if not d.is_dead()]
-
-        if not living_defences:
-            return None
+        self.shop_layout = None
+        self.init_input_router()
 
-        def sqr_dist(d: Defence):
-            dx = enemy.pos.x - d.pos.x
-            dy = enemy.pos.y - d.pos.y
-            return dx * dx + dy * dy
+        self.layout_model.subscribe(self.on_layout_changed)
+        self.startup.mark("game setup")
 
-        return min(living_defences, key=sqr_dist)
+    def get_nearest_defence(self, enemy) -> Defence | None:
+        # answered from defence_grid (rebuilt at the start of update)
+        return self.defence_grid.nearest(enemy.pos.x, enemy.pos.y)
 
     def try_buy_defence(self, defence_type: str):
         cost = DEFENCE_STATS[defence_type]["shop_cost"]
@@ -128,6 +237,7 @@ class Game:
 
         self.gold -= cost
         self.owned_defences.append((defence_type, 1))
+        self.input_router.invalidate("shop")
         print("bought new defence", defence_type, "Lv1")
 
     def open_defence_popup(self, slot_index: int):
@@ -145,7 +255,10 @@ class Game:
         self.defence_popup_open = True
         self.defence_popup_slot = int(slot_index)
         self.selected_slot = slot_index
-        self.defence_popup_layout = build_defence_popup_layout(defence)
+        self.defence_popup_layout = build_defence_popup_layout(
+            defence, self.layout.size
+        )
+        self.input_router.invalidate("defence_popup")
 
     def close_defence_popup(self):
         self.defence_popup_open = False
@@ -162,8 +275,7 @@ class Game:
         self.choose_defence_menu_slot = slot_index
         self.choose_defence_menu_items = []
 
-        slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
-        base_rect = slot_rects[slot_index]
+        base_rect = self.layout.slot_rects[slot_index]
 
         item_width = 140
         item_height = 24
@@ -182,6 +294,17 @@ class Game:
             r = pygame.Rect(x, y + i * (item_height + padding), item_width, item_height)
             self.choose_defence_menu_items.append((label, r, i))
 
+        self.input_router.invalidate("choose_menu")
+
+    def place_owned_defence(self, slot_index: int, owned_index: int):
+        """Move an owned defence into a slot (replacing whatever is there)."""
+        dtype, level = self.owned_defences[owned_index]
+        self.slot_defences[slot_index] = Defence(0, 0, defence_type=dtype, level=level)
+        self.update_defence_positions_from_slots()
+        # remove from owned list
+        del self.owned_defences[owned_index]
+        self.input_router.invalidate("shop")
+
     def close_choose_defence_menu(self):
         self.choose_defence_menu_open = False
         self.choose_defence_menu_slot = None
@@ -202,11 +325,24 @@ class Game:
             self.selected_slot = slot_index
             self.upgrade_selected_slot()
             self.selected_slot = None
-            self.defence_popup_layout = build_defence_popup_layout(defence)
+            self.defence_popup_layout = build_defence_popup_layout(
+                defence, self.layout.size
+            )
+            self.input_router.invalidate("defence_popup")
+            return
+
+        if action == "targeting":
+            idx = TARGETING_POLICIES.index(defence.targeting)
+            defence.targeting = TARGETING_POLICIES[(idx + 1) % len(TARGETING_POLICIES)]
+            self.defence_popup_layout = build_defence_popup_layout(
+                defence, self.layout.size
+            )
+            self.input_router.invalidate("defence_popup")
             return
 
         if action == "remove":
             self.owned_defences.append((defence.defence_type, defence.level))
+            self.input_router.invalidate("shop")
             self.slot_defences[slot_index] = None
             self.update_defence_positions_from_slots()
             self.close_defence_popup()
@@ -241,7 +377,10 @@ class Game:
             self.close_defence_popup()
             return
 
-        self.defence_popup_layout = build_defence_popup_layout(defence)
+        if self.defence_popup_layout is None:
+            self.defence_popup_layout = build_defence_popup_layout(
+                defence, self.layout.size
+            )
         draw_defence_popup_ui(screen, self.font, defence, self.defence_popup_layout)
 
     def upgrade_selected_slot(self):
@@ -263,11 +402,7 @@ class Game:
 
     # ---------- RECT HELPERS ----------
     def get_spawn_rect(self):
-        spawn_width = WIDTH - 100
-        spawn_height = 80
-        x = (WIDTH - spawn_width) // 2
-        y = 0
-        return pygame.Rect(x, y, spawn_width, spawn_height)
+        return self.layout.spawn_rect
 
     # ---------- SLOT GEOMETRY -----
 
@@ -277,8 +412,7 @@ class Game:
 
         # If slot is empty, create a default one (archer)
         if defence is None:
-            slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
-            rect = slot_rects[slot_index]
+            rect = self.layout.slot_rects[slot_index]
             x = rect.centerx
             y = rect.centery
             self.slot_defences[slot_index] = Defence(x, y, defence_type="archer")
@@ -303,9 +437,8 @@ class Game:
 
     # ---------- DEFENCE ---------
     def init_defence(self):
-        slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
-
-        for i, rect in enumerate(slot_rects):
+        # a big slot grid starts with the same few archers as the single row
+        for i, rect in enumerate(self.layout.slot_rects[:SLOT_ROW_MAX]):
             x = rect.centerx
             y = rect.centery
             defence_type = "archer"
@@ -315,8 +448,25 @@ class Game:
 
         self.defences = [d for d in self.slot_defences if d is not None]
 
+    def set_slot_count(self, num_slots: int):
+        """Grow or shrink the slot grid; defences in removed slots go back to owned."""
+        num_slots = max(1, int(num_slots))
+        for defence in self.slot_defences[num_slots:]:
+            if defence is not None:
+                self.owned_defences.append((defence.defence_type, defence.level))
+        del self.slot_defences[num_slots:]
+        self.slot_defences.extend([None] * (num_slots - len(self.slot_defences)))
+        self.slot_labels = [f"slot_{i + 1}" for i in range(num_slots)]
+
+        self.close_defence_popup()
+        self.close_choose_defence_menu()
+        self.selected_slot = None
+        self.input_router.invalidate("shop")
+        # relayout -> on_layout_changed repositions defences and hit targets
+        self.layout_model.resize(self.layout.size, num_slots)
+
     def update_defence_positions_from_slots(self):
-        slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
+        slot_rects = self.layout.slot_rects
 
         for i, defence in enumerate(self.slot_defences):
             if defence is not None:
@@ -337,6 +487,7 @@ class Game:
             return
 
         self.wave_number += 1
+        self.wave_stats.begin_wave(self.wave_number, self.slot_defences)
         spawn_rect = self.get_spawn_rect()
 
         num_enemies = 1 + self.wave_number * 2
@@ -346,6 +497,7 @@ class Game:
             x = spawn_rect.left + (i + 0.5) * (spawn_rect.width / num_enemies)
             y = spawn_rect.bottom + ENEMY_SIZE / 2
             enemy = Enemy(x, y, speed_base)
+            self.ledger.register(enemy)
             self.enemies.append(enemy)
 
     def can_spawn_wave(self) -> bool:
@@ -356,46 +508,358 @@ class Game:
 
         return True
 
-    def handle_shop_popup_click(self, mouse_pos):
-        # if shop isn't open, nothing to do
-        if not self.shop_open:
-            return
+    # ---------- INPUT LAYERS ----------
+    def init_input_router(self):
+        """Register every clickable UI layer, highest priority first."""
+        router = InputRouter(fallback=self.on_background_click)
 
-        popup_rect, shop_rects, owned_rects, close_rect = get_shop_popup_layout(
-            self.owned_defences
+        router.add_layer(
+            HitLayer("action_bar", 100, self.build_action_bar_targets, lambda: True)
+        )
+        router.add_layer(
+            HitLayer(
+                "shop",
+                90,
+                self.build_shop_targets,
+                lambda: self.shop_open,
+                modal=True,
+                on_outside=self.close_shop,
+            )
+        )
+        router.add_layer(
+            HitLayer(
+                "choose_menu",
+                80,
+                self.build_choose_menu_targets,
+                lambda: self.choose_defence_menu_open,
+                modal=True,
+                on_outside=self.on_choose_menu_outside,
+            )
         )
+        router.add_layer(
+            HitLayer(
+                "defence_popup",
+                70,
+                self.build_defence_popup_targets,
+                lambda: self.defence_popup_open,
+                modal=True,
+                on_outside=self.on_defence_popup_outside,
+            )
+        )
+        router.add_layer(HitLayer("slots", 10, self.build_slot_targets, lambda: True))
 
-        # close button
-        if close_rect.collidepoint(mouse_pos):
-            self.shop_open = False
-            return
+        self.input_router = router
 
-        # click outside popup -> close
-        if not popup_rect.collidepoint(mouse_pos):
-            self.shop_open = False
-            return
+    def build_action_bar_targets(self):
+        targets = [
+            (icon["rect"], partial(self.on_action_bar_click, icon["name"]))
+            for icon in self.action_bar.icons
+        ]
+        return targets, None
 
-        # shop area
-        for dtype, rect in shop_rects.items():
-            if rect.collidepoint(mouse_pos):
-                self.try_buy_defence(dtype)
-                return
+    def build_shop_targets(self):
+        self.shop_layout = get_shop_popup_layout(self.owned_defences, self.layout.size)
+        popup_rect, shop_rects, owned_rects, close_rect = self.shop_layout
 
+        targets = [(close_rect, self.close_shop)]
+        for dtype, rect in shop_rects.items():
+            targets.append((rect, partial(self.try_buy_defence, dtype)))
+        for owned_index, rect in owned_rects:
+            targets.append((rect, partial(self.on_owned_defence_click, owned_index)))
+        return targets, popup_rect
+
+    def build_choose_menu_targets(self):
+        targets = [
+            (rect, partial(self.on_choose_menu_item_click, owned_index))
+            for _label, rect, owned_index in self.choose_defence_menu_items
+        ]
+        return targets, None
+
+    def build_defence_popup_targets(self):
+        layout = self.defence_popup_layout
+        if layout is None and self.defence_popup_slot is not None:
+            defence = self.slot_defences[self.defence_popup_slot]
+            if defence is not None:
+                layout = build_defence_popup_layout(defence, self.layout.size)
+                self.defence_popup_layout = layout
+
+        if layout is None:
+            return [], None
+
+        targets = [
+            (rect, partial(self.handle_defence_popup_action, action))
+            for action, _label, rect in layout.button_rects
+        ]
+        return targets, layout.popup_rect
+
+    def build_slot_targets(self):
+        targets = [
+            (rect, partial(self.open_defence_popup, i))
+            for i, rect in enumerate(self.layout.slot_hit_rects)
+        ]
+        return targets, None
+
+    # ---------- CLICK HANDLERS ----------
+    def on_action_bar_click(self, name: str):
+        print(f"{name} icon clicked")
+
+        if name == "shop":
+            self.shop_open = True
+            self.close_defence_popup()
+            self.close_choose_defence_menu()
+        elif name == "next_wave":
+            if self.can_spawn_wave():
+                self.spawn_wave()
+        elif name == "gold":
+            print(f"Current gold: {self.gold}")
+            # or later, open some stats/tooltip
+
+    def close_shop(self):
+        self.shop_open = False
+
+    def on_owned_defence_click(self, owned_index: int):
         # owned area (for now just select / do nothing special,
         # you can extend later)
-        for owned_index, rect in owned_rects:
-            if rect.collidepoint(mouse_pos):
-                dtype, level = self.owned_defences[owned_index]
-                print(f"Clicked owned defence: {dtype} Lv{level}")
-                return
+        dtype, level = self.owned_defences[owned_index]
+        print(f"Clicked owned defence: {dtype} Lv{level}")
+
+    def on_choose_menu_item_click(self, owned_index: int):
+        if self.choose_defence_menu_slot is not None:
+            self.place_owned_defence(self.choose_defence_menu_slot, owned_index)
+
+        self.close_choose_defence_menu()
+        self.selected_slot = None
+
+    def on_choose_menu_outside(self):
+        # clicked outside choose menu -> just close it and stop
+        self.close_choose_defence_menu()
+        self.selected_slot = None
+
+    def on_defence_popup_outside(self):
+        self.close_defence_popup()
+        self.selected_slot = None
+
+    def on_background_click(self):
+        # Clicked somewhere else -> reset
+        self.selected_slot = None
+        self.close_defence_popup()
+        self.close_choose_defence_menu()
+
+    # ---------- SAVE / LOAD ----------
+    def save(self, path: str):
+        save_game(self, path)
+        print("Saved game to", path)
+
+    def load(self, path: str):
+        try:
+            load_game(self, path)
+        except (OSError, ValueError) as exc:
+            print("Could not load save:", exc)
+            return
+
+        self.close_defence_popup()
+        self.close_choose_defence_menu()
+        self.selected_slot = None
+        self.shop_open = False
+        self.input_router.invalidate_all()
+        print("Loaded game from", path)
+
+    # ---------- TELEMETRY ----------
+    def start_telemetry(self, host: str, port: int):
+        from core.telemetry import Telemetry
+
+        self.telemetry = Telemetry()
+        for name in (
+            "cache_hits_total",
+            "cache_misses_total",
+            "projectile_hits_total",
+            "projectile_misses_total",
+            "projectile_wasted_ticks_total",
+        ):
+            self.telemetry.declare(name, "counter")
+        try:
+            self.telemetry.start(host, port)
+        except OSError as exc:
+            print("Could not start telemetry:", exc)
+            self.telemetry = None
+
+    def collect_metrics(self):
+        """Copy this frame's numbers into the telemetry store (dict writes only)."""
+        t = self.telemetry
+        p = self.profiler
+
+        t.set("fps", self.clock.get_fps())
+        t.set("update_ms", p.get("update"))
+        t.set("draw_ms", p.get("draw"))
+        t.set("frame_ms", p.get("frame"))
+        t.set("quality_level", self.quality.level)
+
+        t.set("gold", self.gold)
+        t.set("wave", self.wave_number)
+        t.set("castle_hp", self.castle_hp)
+        t.set("projectile_hits_total", self.shot_stats.hits)
+        t.set("projectile_misses_total", self.shot_stats.misses)
+        t.set("projectile_wasted_ticks_total", self.shot_stats.wasted_ticks)
+
+        t.set("entities", len(self.enemies), (("type", "enemy"),))
+        t.set("entities", len(self.projectiles), (("type", "projectile"),))
+        t.set("entities", len(self.defences), (("type", "defence"),))
+        t.set("entities", len(self.damage_numbers), (("type", "damage_number"),))
+        t.set("entities", len(self.aoe_effects), (("type", "aoe_effect"),))
+        t.set("entities", len(self.beam_effects), (("type", "beam_effect"),))
+
+        atlas = get_digit_atlas(self.font)
+        t.set("cache_hits_total", atlas.hits, (("cache", "digit_atlas"),))
+        t.set("cache_misses_total", atlas.misses, (("cache", "digit_atlas"),))
+        for name, (hits, misses) in cache_stats.items():
+            t.set("cache_hits_total", hits, (("cache", name),))
+            t.set("cache_misses_total", misses, (("cache", name),))
+        if self.render_prep is not None:
+            t.set(
+                "cache_hits_total", self.render_prep.hits, (("cache", "render_text"),)
+            )
+            t.set(
+                "cache_misses_total",
+                self.render_prep.misses,
+                (("cache", "render_text"),),
+            )
+
+    # ---------- BALANCE ----------
+    def poll_balance(self):
+        """Swap in reloaded defence stats, if the watcher has a new set ready."""
+        if self.balance is None:
+            return
+        tables = self.balance.take()
+        if tables is None:
+            return
+
+        stats_table, specs = tables
+        apply_tables(stats_table, specs)
+        for defence in self.slot_defences:
+            if defence is not None:
+                defence.apply_spec(get_spec(defence.defence_type))
+
+        # costs shown in the shop / popup may have changed
+        self.defence_popup_layout = None
+        self.input_router.invalidate("shop")
+        self.input_router.invalidate("defence_popup")
+
+    # ---------- WHAT-IF ----------
+    def start_what_if(self, waves: int = 3):
+        """Evaluate every placement / upgrade option in background processes."""
+        # process pools are only imported once the planner is first used
+        from core.what_if import WhatIfPlanner, list_choices
+
+        if self.what_if is None:
+            self.what_if = WhatIfPlanner()
+        if self.what_if.is_busy():
+            print("What-if already running")
+            return
+
+        choices = list_choices(self)
+        self.what_if.submit(self, choices, waves=waves)
+        print(f"What-if: evaluating {len(choices)} options...")
+
+    def poll_what_if(self):
+        if self.what_if is None:
+            return
+        results = self.what_if.poll()
+        if results is None:
+            return
+
+        print("What-if results (best first):")
+        for r in results:
+            print(
+                f"  {r.choice.label()}: {r.waves_survived} waves, "
+                f"castle {int(r.castle_hp)} hp, {r.gold}g"
+            )
 
     # ---------- MAIN LOOP ----------
+    def step(self, dt: float):
+        """One frame of work (everything except waiting for the next tick)."""
+        profiler = self.profiler
+        profiler.begin("frame")
+
+        self.handle_events()
+
+        profiler.begin("update")
+        self.update(dt)
+        profiler.end("update")
+
+        if self.render_prep is not None:
+            # prepared on the helper thread while draw() blits the background
+            self.pending_prep = self.render_prep.submit(self.make_render_snapshot())
+
+        self.poll_what_if()
+
+        profiler.begin("draw")
+        self.draw()
+        profiler.end("draw")
+
+        self.quality.record_frame(profiler.end("frame"))
+
+        if self.startup is not None:
+            self.startup.mark("first frame")
+            self.startup_ms = self.startup.total_ms
+            if STARTUP_REPORT and not self.headless:
+                print(self.startup.report())
+            self.startup = None
+
+        if self.telemetry is not None:
+            self.collect_metrics()
+
     def run(self):
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+            self.step(dt)
+        self.shutdown()
+
+    async def run_async(self):
+        """
+        Same loop as run(), but sleeps with asyncio between frames so other
+        tasks on the event loop (servers, scripted tests, pygbag) get to run.
+
+        Frames are scheduled against the loop clock instead of
+        clock.tick(FPS), so time spent in other tasks is absorbed by the
+        sleep rather than adding up as drift.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        frame_time = 1.0 / FPS
+        last = loop.time()
+        next_frame = last + frame_time
+
+        while self.running:
+            now = loop.time()
+            dt = now - last
+            last = now
+
+            self.clock.tick()  # keeps clock.get_fps() meaningful
+            self.step(dt)
+
+            delay = next_frame - loop.time()
+            if delay < 0:
+                # running behind: don't try to catch up with a burst of frames
+                next_frame = loop.time()
+                delay = 0.0
+            next_frame += frame_time
+
+            # always await, even with no time left, so other tasks run
+            await asyncio.sleep(delay)
+
+        self.shutdown()
+
+    def shutdown(self):
+        if self.telemetry is not None:
+            self.telemetry.stop()
+        if self.balance is not None:
+            self.balance.stop()
+        if self.what_if is not None:
+            self.what_if.shutdown()
+        self.stop_recording()
+        if self.render_prep is not None:
+            self.render_prep.shutdown()
         pygame.quit()
 
     # ---------- EVENTS ----------
@@ -404,6 +868,9 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            if event.type == pygame.WINDOWSIZECHANGED:
+                self.handle_window_resized()
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
@@ -412,6 +879,18 @@ class Game:
                         self.spawn_wave()
                 if event.key == pygame.K_u:
                     self.upgrade_selected_slot()
+                if event.key == pygame.K_F5:
+                    self.save(SAVE_PATH)
+                if event.key == pygame.K_F9:
+                    self.load(SAVE_PATH)
+                if event.key == pygame.K_F11:
+                    self.toggle_fullscreen()
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                if event.key == pygame.K_F8:
+                    self.toggle_recording()
+                if event.key == pygame.K_p:
+                    self.start_what_if()
                 # NEW: toggle shop popup
                 if event.key == pygame.K_i:
                     self.shop_open = not self.shop_open
@@ -422,129 +901,37 @@ class Game:
                         self.selected_slot = None
 
             if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = event.pos
-
                 if event.button == 1:
-
-                    clicked_icon = self.action_bar.handle_click(mouse_pos)
-                    if clicked_icon == "shop":
-                        self.shop_open = True
-                        self.close_defence_popup()
-                        self.close_choose_defence_menu()
-                        return
-
-                    if clicked_icon == "next_wave":
-                        if self.can_spawn_wave():
-                            self.spawn_wave()
-                        return
-
-                    if clicked_icon == "gold":
-                        print(f"Current gold: {self.gold}")
-                        # or later, open some stats/tooltip
-                        return
-
-                    # If shop popup is open, it has priority for clicks
-                    if self.shop_open:
-                        self.handle_shop_popup_click(mouse_pos)
-                        return
-
-                    # 1) If choose-defence menu is open, handle it FIRST (modal)
-                    if self.choose_defence_menu_open:
-                        clicked_any = False
-                        for label, rect, owned_index in self.choose_defence_menu_items:
-                            if rect.collidepoint(mouse_pos):
-                                clicked_any = True
-                                if self.choose_defence_menu_slot is not None:
-                                    slot_index = self.choose_defence_menu_slot
-                                    # place new Defence in that slot
-                                    slot_rects = compute_slot_rects(
-                                        self.screen, len(self.slot_labels)
-                                    )
-                                    srect = slot_rects[slot_index]
-
-                                    dtype, level = self.owned_defences[owned_index]
-                                    new_def = Defence(
-                                        srect.centerx,
-                                        srect.centery,
-                                        defence_type=dtype,
-                                        level=level,
-                                    )
-                                    self.slot_defences[slot_index] = new_def
-                                    self.update_defence_positions_from_slots()
-                                    # remove from owned list
-                                    del self.owned_defences[owned_index]
-
-                                self.close_choose_defence_menu()
-                                self.selected_slot = None
-                                return
-
-                        # clicked outside choose menu -> just close it and stop
-                        self.close_choose_defence_menu()
-                        self.selected_slot = None
-                        return
-
-                    # 2) Defence detail popup handling (modal)
-                    if self.defence_popup_open:
-                        layout = self.defence_popup_layout
-                        if (
-                            layout is None
-                            and self.defence_popup_slot is not None
-                            and self.slot_defences[self.defence_popup_slot] is not None
-                        ):
-                            defence = self.slot_defences[self.defence_popup_slot]
-                            if defence is not None:
-                                layout = build_defence_popup_layout(defence)
-                                self.defence_popup_layout = layout
-
-                        if layout is not None:
-                            for action, _label, rect in layout.button_rects:
-                                if rect.collidepoint(mouse_pos):
-                                    self.handle_defence_popup_action(action)
-                                    return
-
-                            if layout.popup_rect.collidepoint(mouse_pos):
-                                return
-
-                        self.close_defence_popup()
-                        self.selected_slot = None
-                        return
-
-                    # 3) Normal slot click (open defence popup or choose menu)
-                    slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
-                    slot_index = get_slot_index_at_pos(slot_rects, mouse_pos)
-
-                    if slot_index is not None:
-                        self.open_defence_popup(slot_index)
-                        return
-
-                    # Clicked somewhere else -> reset
-                    self.selected_slot = None
-                    self.close_defence_popup()
-                    self.close_choose_defence_menu()
-                    return
+                    self.input_router.dispatch(event.pos)
 
                 # Right click here
 
     # ---------- UPDATE ----------
     def update(self, dt):
-        castle_rect = self.get_castle_rect()
+        self.poll_balance()
+        advance_animations(dt)
 
-        if not self.is_game_over:
+        castle_rect = self.layout.castle_rect
+        # one scratch rect reused as every enemy's move target this tick
+        target_rect = self.target_rect
 
-            had_enemies_before = len(self.enemies) > 0
+        if not self.is_game_over:
 
             # update enemies and calc dmg
             # update enemies and calc dmg
             damage_to_castle = 0.0
             damage_per_enemy = self.castle_damage_per_second_per_enemy
 
+            # one grid of living defences answers every enemy's nearest query
+            defence_grid = self.defence_grid
+            defence_grid.rebuild(d for d in self.defences if not d.is_dead())
+
             for enemy in self.enemies:
                 # 1) Prefer NEAREST DEFENCE anywhere on the map, if any exist
                 target_def = self.get_nearest_defence(enemy)
 
                 if target_def is not None:
-                    # build a small rect centered on the defence for Enemy.update
-                    target_rect = pygame.Rect(0, 0, 10, 10)
+                    # small rect centered on the defence for Enemy.update
                     target_rect.center = (target_def.pos.x, target_def.pos.y)
 
                     # move enemy toward that defence
@@ -553,6 +940,11 @@ class Game:
                     # if in attack range, damage that defence
                     if enemy.state == "attacking":
                         target_def.take_damage(damage_per_enemy * dt)
+                        if target_def.is_dead():
+                            # the rest of this tick's enemies look elsewhere
+                            defence_grid.remove(
+                                target_def, target_def.pos.x, target_def.pos.y
+                            )
 
                 else:
                     # --- no defences left -> target NEAREST POINT on the castle rect ---
@@ -578,8 +970,7 @@ class Game:
                         # enemy is exactly at nearest point already
                         target_x, target_y = nearest_x, nearest_y
 
-                    # 3) build tiny target rect at that shifted point
-                    target_rect = pygame.Rect(0, 0, 10, 10)
+                    # 3) move tiny target rect to that shifted point
                     target_rect.center = (target_x, target_y)
 
                     enemy.update(dt, target_rect)
@@ -587,12 +978,15 @@ class Game:
                     if enemy.state == "attacking" and self.castle_hp > 0:
                         damage_to_castle += damage_per_enemy * dt
 
+            self.separate_enemies()
+
             if damage_to_castle > 0:
                 self.castle_hp = max(0.0, self.castle_hp - damage_to_castle)
 
             if self.castle_hp <= 0:
                 self.castle_hp = 0
                 self.is_game_over = True
+                self.wave_stats.end_wave(self.slot_defences)
 
             for i, d in enumerate(self.slot_defences):
                 if d is not None and d.is_dead():
@@ -600,41 +994,125 @@ class Game:
 
             self.defences = [d for d in self.defences if not d.is_dead()]
 
+            # one index per tick answers every defence's targeting query;
+            # the shots are then aimed together
+            self.target_index.rebuild(self.enemies)
+            shots = []
             for defence in self.defences:
-                defence.update(dt, self.enemies, self.projectiles)
-
-            alive_before = sum(1 for e in self.enemies if not e.is_dead)
+                defence.update(
+                    dt, self.enemies, self.projectiles, self.target_index, shots
+                )
+            if shots:
+                projectile_shots = [s for s in shots if s[0].attack == "projectile"]
+                instant_shots = [s for s in shots if s[0].attack != "projectile"]
+                self.projectiles.extend(aim_shots(projectile_shots, LEAD_TARGETS))
+                # chain / beam kinds hit right away, no projectiles involved
+                self.beam_effects.extend(
+                    resolve_instant_shots(
+                        instant_shots,
+                        self.target_index,
+                        self.damage_numbers,
+                        self.status_effects,
+                    )
+                )
 
             for proj in self.projectiles:
-                proj.update(dt, self.enemies, self.damage_numbers, self.aoe_effects)
-
-            for dn in self.damage_numbers:
-                dn.update(dt)
-            self.damage_numbers = [dn for dn in self.damage_numbers if not dn.is_dead()]
-
-            alive_after = sum(1 for e in self.enemies if not e.is_dead)
-            killed_this_frame = alive_before - alive_after
-            if killed_this_frame > 0:
-                self.gold += killed_this_frame * GOLD_PER_KILL
-
-            self.projectiles = [p for p in self.projectiles if not p.is_dead]
-            self.enemies = [e for e in self.enemies if not e.is_dead]
+                proj.update(
+                    dt,
+                    self.enemies,
+                    self.damage_numbers,
+                    self.aoe_effects,
+                    self.status_effects,
+                )
+
+            # slows / burns / stuns for every affected enemy in one pass
+            self.status_effects.update(dt, self.damage_numbers)
+
+            self.damage_numbers.update(dt)
+
+            # every kill of this tick, as reported by the enemies themselves
+            deaths = self.ledger.drain()
+            if deaths:
+                self.gold += len(deaths) * GOLD_PER_KILL
+                for _enemy, source in deaths:
+                    if source is not None:
+                        source.stats.gold += GOLD_PER_KILL
+                self.enemies = [e for e in self.enemies if not e.is_dead]
+
+            live_projectiles = []
+            for p in self.projectiles:
+                if p.is_dead:
+                    self.shot_stats.record(p)
+                else:
+                    live_projectiles.append(p)
+            self.projectiles = live_projectiles
 
             for aoe in self.aoe_effects:
                 aoe.update(dt)
             self.aoe_effects = [a for a in self.aoe_effects if not a.is_dead()]
+            for beam in self.beam_effects:
+                beam.update(dt)
+            self.beam_effects = [b for b in self.beam_effects if not b.is_dead()]
 
-            if had_enemies_before and len(self.enemies) == 0 and not self.is_game_over:
+            if deaths and self.ledger.alive == 0 and not self.is_game_over:
                 bonus = GOLD_PER_WAVE_CLEAR * max(1, self.wave_number)
                 self.gold += bonus
+                self.wave_stats.end_wave(self.slot_defences)
+
+    def separate_enemies(self):
+        """Push overlapping enemies apart so they spread around their target."""
+        enemies = self.enemies
+        if len(enemies) < 2:
+            return
+
+        grid = self.enemy_grid
+        grid.rebuild(enemies)
+
+        radius = ENEMY_SEPARATION_RADIUS
+        radius_sq = radius * radius
+        max_neighbours = ENEMY_SEPARATION_MAX_NEIGHBOURS
+
+        for enemy in enemies:
+            ex, ey = enemy.pos.x, enemy.pos.y
+            push_x = push_y = 0.0
+            found = 0
+
+            for other in grid.query_radius(ex, ey, radius):
+                if other is enemy:
+                    continue
+                dx = ex - other.pos.x
+                dy = ey - other.pos.y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= radius_sq:
+                    continue
+
+                if dist_sq > 0:
+                    dist = dist_sq**0.5
+                    overlap = (radius - dist) / dist
+                    push_x += dx * overlap
+                    push_y += dy * overlap
+                else:
+                    # exactly on top of each other: split them apart sideways
+                    push_x += radius if id(enemy) < id(other) else -radius
+
+                found += 1
+                if found >= max_neighbours:
+                    break
+
+            if found:
+                # each side of a pair moves half the overlap
+                enemy.pos.x += push_x * 0.5 * ENEMY_SEPARATION_STRENGTH
+                enemy.pos.y += push_y * 0.5 * ENEMY_SEPARATION_STRENGTH
+                enemy.rect.center = (int(enemy.pos.x), int(enemy.pos.y))
 
     # ---------- DRAW ----------
     def draw(self):
 
         # Layout rects
-        hp_bar_rect = self.get_hp_bar_rect()
-        castle_rect = self.get_castle_rect()
-        playfield_rect = pygame.Rect(0, 0, WIDTH, castle_rect.top)
+        layout = self.layout
+        hp_bar_rect = layout.hp_bar_rect
+        castle_rect = layout.castle_rect
+        playfield_rect = layout.playfield_rect
 
         # 1) Background (UI strips, etc.)
         draw_background(self.screen, castle_rect, hp_bar_rect)
@@ -647,7 +1125,7 @@ class Game:
                 self.screen.blit(tex, (x, y))
 
         # 3) Slot rects (for drawing + hitboxes)
-        slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
+        slot_rects = layout.slot_rects
 
         # 4) Slot spots (over grass, behind castle & icons)
         draw_slot_spots(self.screen, slot_rects)
@@ -660,6 +1138,7 @@ class Game:
             self.slot_defences,
             self.selected_slot,
             slot_rects,
+            shake=self.quality.show_shake,
         )
 
         # 6) Defences (these are the “towers” that should be behind the wall)
@@ -672,18 +1151,33 @@ class Game:
             for x in range(castle_rect.x, castle_rect.right, ttw):
                 self.screen.blit(self.castle_wall_img, (x, y))
 
+        # everything below may use work done by the render prep thread
+        prepared = self.take_prepared_frame()
+
         # 8) Enemies, projectiles, AoE – in front of the wall
-        for aoe in self.aoe_effects:
-            aoe.draw(self.screen)
+        quality = self.quality
+        if quality.show_aoe:
+            for aoe in self.aoe_effects:
+                aoe.draw(self.screen)
 
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+        draw_enemies(
+            self.screen,
+            self.enemies,
+            playfield_rect,
+            show_hp_bars=quality.show_enemy_hp_bars,
+            hp_bar_rects=prepared.hp_bar_rects if prepared else None,
+        )
 
         for projectile in self.projectiles:
             projectile.draw(self.screen)
 
+        if quality.show_aoe:
+            for beam in self.beam_effects:
+                beam.draw(self.screen)
+
         # 9) Damage numbers
-        draw_damage_numbers(self.screen, self.font, self.damage_numbers)
+        if quality.show_damage_numbers:
+            draw_damage_numbers(self.screen, self.font, self.damage_numbers)
 
         # 10) Castle HP bar (UI)
         draw_castle_hp(
@@ -692,62 +1186,203 @@ class Game:
             self.castle_hp,
             self.castle_max_hp,
             hp_bar_rect,
+            text_surf=prepared.castle_hp_text if prepared else None,
         )
 
         # 11) Menus & popups on top
         self.draw_defence_popup(self.screen)
         self.draw_choose_defence_menu(self.screen)
-        draw_shop_popup(self.screen, self.font, self.shop_open, self.owned_defences)
+        if self.shop_open:
+            self.input_router.refresh("shop")
+        draw_shop_popup(
+            self.screen,
+            self.font,
+            self.shop_open,
+            self.owned_defences,
+            self.shop_layout,
+        )
 
         # 12) Game over overlay, if any
         if self.is_game_over:
             draw_game_overlay(self.screen, self.font, self.big_font)
 
         # 13) Action bar & wave info
-        self.action_bar.draw(self.gold, self.wave_number + 1)
+        if prepared is not None:
+            self.action_bar.draw(
+                self.gold,
+                self.wave_number + 1,
+                gold_surf=prepared.gold_text,
+                wave_surf=prepared.wave_text,
+            )
+        else:
+            self.action_bar.draw(self.gold, self.wave_number + 1)
+
+        # 14) Profiler panel (F3)
+        if self.profiler.visible:
+            draw_profiler(self.screen, self.font, self.profiler_lines())
+
+        if self.recorder is not None:
+            self.recorder.submit(self.screen)
+
+        if not self.headless:
+            pygame.display.flip()
+
+    # ---------- CAPTURE ----------
+    def frame_pixels(self):
+        """Context manager: zero-copy NumPy view of the last drawn frame."""
+        return frame_pixels(self.screen)
+
+    def save_thumbnail(self, path: str, width: int = 320):
+        save_thumbnail(self.screen, path, width)
+
+    def start_recording(self, out_dir: str | None = None, fmt: str | None = None):
+        if self.recorder is not None:
+            return
+        if out_dir is None:
+            out_dir = os.path.join(CAPTURE_DIR, time.strftime("%Y%m%d_%H%M%S"))
+
+        kwargs = {} if fmt is None else {"fmt": fmt}
+        self.recorder = FrameRecorder(out_dir, fps=FPS, **kwargs)
+        self.recorder.start()
+        print("Recording to", out_dir)
+
+    def stop_recording(self):
+        if self.recorder is None:
+            return
+        recorder = self.recorder
+        self.recorder = None
+        recorder.stop()
+        print(f"Recorded {recorder.written} frames ({recorder.dropped} dropped)")
+        if recorder.error is not None:
+            print(
+                f"Recording stopped early ({recorder.failed} frames lost):",
+                recorder.error,
+            )
 
-        pygame.display.flip()
+    def toggle_recording(self):
+        if self.recorder is None:
+            self.start_recording()
+        else:
+            self.stop_recording()
 
     # ---------- DRAW HELPERS ----------
+    def make_render_snapshot(self) -> RenderSnapshot:
+        return RenderSnapshot(
+            gold=self.gold,
+            wave_label=self.wave_number + 1,
+            castle_hp=self.castle_hp,
+            castle_max_hp=self.castle_max_hp,
+            show_hp_bars=self.quality.show_enemy_hp_bars,
+            enemies=tuple((e.pos.x, e.pos.y, e.hp, e.max_hp) for e in self.enemies),
+        )
+
+    def take_prepared_frame(self):
+        """Wait for this tick's render prep result (None if prep is off)."""
+        if self.pending_prep is None:
+            return None
+        future = self.pending_prep
+        self.pending_prep = None
+        return future.result()
+
+    def profiler_lines(self) -> list[str]:
+        p = self.profiler
+        return [
+            f"FPS: {self.clock.get_fps():.0f}",
+            f"update: {p.get('update'):.2f} ms",
+            f"draw: {p.get('draw'):.2f} ms",
+            f"frame: {p.get('frame'):.2f} / {self.quality.budget_ms:.1f} ms",
+            f"enemies: {len(self.enemies)}  proj: {len(self.projectiles)}",
+            f"hit rate: {self.shot_stats.hit_rate:.0%}  wasted: {self.shot_stats.wasted_ticks}",
+            f"quality: {self.quality.level} ({self.quality.name})",
+        ]
 
     def draw_game_overlay(self, screen):
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))  # semi-transparent black
-        screen.blit(overlay, (0, 0))
+        width, height = screen.get_size()
+        # semi-transparent black
+        screen.blit(get_overlay((width, height), (0, 0, 0, 160)), (0, 0))
 
         # big text
         text_surf = self.big_font.render("GAME OVER", True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
+        text_rect = text_surf.get_rect(center=(width // 2, height // 2 - 30))
 
         screen.blit(text_surf, text_rect)
 
         # small hint
 
         small = self.font.render("Press ESC to quit", True, (220, 220, 220))
-        small_rect = small.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 20))
+        small_rect = small.get_rect(center=(width // 2, height // 2 + 20))
 
         screen.blit(small, small_rect)
 
     def draw_slots(self, screen, font, labels):
-        slot_rects = compute_slot_rects(self.screen, len(self.slot_labels))
         draw_slots_ui(
             screen,
             font,
             labels,
             self.slot_defences,
             self.selected_slot,
-            slot_rects,
+            self.layout.slot_rects,
+            shake=self.quality.show_shake,
         )
 
+    # ---------- LAYOUT ----------
+    @property
+    def layout(self) -> Layout:
+        return self.layout_model.current
+
+    def on_resize(self, width: int, height: int):
+        """Recompute all screen geometry; dependants are notified by the model."""
+        self.layout_model.resize((width, height), len(self.slot_labels))
+
+    def on_layout_changed(self, layout: Layout):
+        self.update_defence_positions_from_slots()
+        self.action_bar.relayout(layout.size)
+        # popups are centered on screen -> rebuild on next use
+        self.defence_popup_layout = None
+        self.input_router.invalidate_all()
+
+    # ---------- WINDOW ----------
+    def create_window(self, size: tuple[int, int]) -> pygame.Surface:
+        """
+        "scaled": the game always renders at WIDTH x HEIGHT and SDL scales
+        that surface to the window (letterboxed, mouse mapped for us).
+        "native": the window size is the render size and the layout is
+        recomputed on every resize.
+        """
+        if WINDOW_MODE == "scaled":
+            flags = pygame.SCALED | pygame.RESIZABLE
+            if self.fullscreen:
+                flags |= pygame.FULLSCREEN
+            return pygame.display.set_mode((WIDTH, HEIGHT), flags)
+
+        if self.fullscreen:
+            return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        return pygame.display.set_mode(size, pygame.RESIZABLE)
+
+    def toggle_fullscreen(self):
+        if self.headless:
+            return
+        self.fullscreen = not self.fullscreen
+        if WINDOW_MODE == "scaled":
+            pygame.display.toggle_fullscreen()
+            return
+
+        self.screen = self.create_window((WIDTH, HEIGHT))
+        self.action_bar.screen = self.screen
+        self.on_resize(*self.screen.get_size())
+
+    def handle_window_resized(self):
+        if self.headless or WINDOW_MODE == "scaled":
+            return  # logical size never changes
+        self.screen = pygame.display.get_surface()
+        self.action_bar.screen = self.screen
+        self.on_resize(*self.screen.get_size())
+
     # ---------- RECT HELPERS ----------
     def get_hp_bar_rect(self):
         """Bottom-most row: full-width castle HP bar."""
-        bar_height = 44
-        return pygame.Rect(0, HEIGHT - bar_height, WIDTH, bar_height)
+        return self.layout.hp_bar_rect
 
     def get_castle_rect(self):
         """Castle area sits directly above the HP bar."""
-        castle_height = 140  # tweak if you want it taller/shorter
-        hp_bar_rect = self.get_hp_bar_rect()
-        y = hp_bar_rect.top - castle_height
-        return pygame.Rect(0, y, WIDTH, castle_height)
+        return self.layout.castle_rect
@@ -0,0 +1,126 @@
+# src/core/hitscan.py
+import random
+
+from config import ENEMY_SIZE
+from entities.beam_effect import BeamEffect
+
+# defence "attack" kinds resolved here instead of spawning projectiles
+INSTANT_ATTACKS = ("chain", "beam")
+
+
+def _hit(defence, enemy, damage, crit, damage_numbers, status_effects):
+    enemy.take_damage(damage, defence)
+    defence.stats.hits += 1
+    if defence.on_hit is not None:
+        status_effects.apply(enemy, defence.on_hit, defence)
+    color = (255, 255, 0) if crit else (255, 80, 80)
+    damage_numbers.add(enemy.get_rect().midtop, damage, color, enemy)
+
+
+def resolve_chain(
+    defence, target, targets, damage, crit, damage_numbers, status_effects
+):
+    """
+    Lightning: hit ``target``, then jump to the nearest enemy not hit yet
+    within ``chain_range``, up to ``chain_count`` jumps, each jump dealing
+    ``chain_falloff`` times the previous damage.
+    """
+    points = [(defence.pos.x, defence.pos.y)]
+    hit = set()
+    current = target
+    for _ in range(defence.chain_count + 1):
+        _hit(defence, current, damage, crit, damage_numbers, status_effects)
+        hit.add(current)
+        points.append((current.pos.x, current.pos.y))
+
+        cx, cy = current.pos.x, current.pos.y
+        reach_sq = defence.chain_range * defence.chain_range
+        best = None
+        best_sq = reach_sq
+        for enemy in targets.grid.query_radius(cx, cy, defence.chain_range):
+            if enemy.is_dead or enemy in hit:
+                continue
+            dx = enemy.pos.x - cx
+            dy = enemy.pos.y - cy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= best_sq:
+                best = enemy
+                best_sq = dist_sq
+        if best is None:
+            break
+        current = best
+        damage *= defence.chain_falloff
+
+    return BeamEffect(points, defence.projectile_color, width=3)
+
+
+def resolve_beam(
+    defence, target, targets, damage, crit, damage_numbers, status_effects
+):
+    """
+    Laser: a straight segment from the defence through ``target`` out to full
+    range; every enemy whose body touches the beam is hit once.
+    """
+    sx, sy = defence.pos.x, defence.pos.y
+    dx = target.pos.x - sx
+    dy = target.pos.y - sy
+    length = (dx * dx + dy * dy) ** 0.5
+    if length == 0:
+        return None
+    ux, uy = dx / length, dy / length
+    reach = defence.base_range
+    ex, ey = sx + ux * reach, sy + uy * reach
+
+    # enemies are tested as circles around their centre
+    half_width = defence.beam_width / 2 + ENEMY_SIZE / 2
+    half_width_sq = half_width * half_width
+
+    # one grid query covering the whole segment
+    mx, my = (sx + ex) / 2, (sy + ey) / 2
+    for enemy in targets.grid.query_radius(mx, my, reach / 2 + half_width):
+        if enemy.is_dead:
+            continue
+        px = enemy.pos.x - sx
+        py = enemy.pos.y - sy
+        along = px * ux + py * uy
+        if along < 0 or along > reach:
+            continue
+        # perpendicular distance from the beam line
+        off = px * uy - py * ux
+        if off * off <= half_width_sq:
+            _hit(defence, enemy, damage, crit, damage_numbers, status_effects)
+
+    return BeamEffect(
+        [(sx, sy), (ex, ey)], defence.projectile_color, width=defence.beam_width
+    )
+
+
+RESOLVERS = {
+    "chain": resolve_chain,
+    "beam": resolve_beam,
+}
+
+
+def resolve_instant_shots(shots, targets, damage_numbers, status_effects):
+    """
+    Resolve this tick's chain / beam shots against the enemy set right away.
+    ``targets`` is the per-tick TargetIndex. Returns the visual effects.
+    """
+    effects = []
+    for defence, target in shots:
+        if target.is_dead:
+            # killed earlier this tick by another instant shot
+            continue
+        crit = random.random() < defence.crit_chance
+        damage = defence.base_damage * (defence.crit_multiplier if crit else 1.0)
+        defence.stats.shots += 1
+        if crit:
+            defence.stats.crits += 1
+        effect = RESOLVERS[defence.attack](
+            defence, target, targets, damage, crit, damage_numbers, status_effects
+        )
+        if effect is not None:
+            effects.append(effect)
+        defence.time_since_last_shot = 0.0
+        defence.shake_time = defence.shake_duration
+    return effects
@@ -0,0 +1,48 @@
+# src/core/ledger.py
+
+
+class CombatLedger:
+    """
+    Damage and kill events for one game.
+
+    Enemies report into it from ``take_damage`` as the hits happen; Game
+    drains the deaths once per tick for gold and wave-clear instead of
+    recounting the living enemies. The ``source`` of a hit (the Defence
+    that dealt it, or None) gets its damage / kill / overkill counters
+    (``Defence.stats``) bumped here too.
+    """
+
+    def __init__(self):
+        self.alive = 0  # registered enemies not dead yet
+        self.deaths: list[tuple] = []  # (enemy, source) since the last drain
+        self.total_damage = 0.0
+        self.total_kills = 0
+
+    def register(self, enemy):
+        enemy.ledger = self
+        self.alive += 1
+
+    def reset(self, enemies):
+        """Start over from an existing enemy list (e.g. after loading a save)."""
+        self.alive = 0
+        self.deaths = []
+        for enemy in enemies:
+            self.register(enemy)
+
+    def damage(self, enemy, amount: float, source=None):
+        self.total_damage += amount
+        if source is not None:
+            source.stats.damage += amount
+
+    def death(self, enemy, source=None, overkill: float = 0.0):
+        self.alive -= 1
+        self.total_kills += 1
+        self.deaths.append((enemy, source))
+        if source is not None:
+            source.stats.kills += 1
+            source.stats.overkill += overkill
+
+    def drain(self) -> list[tuple]:
+        deaths = self.deaths
+        self.deaths = []
+        return deaths
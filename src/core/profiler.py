@@ -0,0 +1,64 @@
+# src/core/profiler.py
+import time
+
+
+class FrameProfiler:
+    """
+    Smoothed per-frame timings (update / draw / total work).
+
+    ``begin``/``end`` wrap a named section; averages are exponential moving
+    averages so the numbers are stable enough to read on screen.
+    """
+
+    def __init__(self, smoothing: float = 0.1):
+        self.smoothing = smoothing
+        self.avg_ms: dict[str, float] = {}
+        self.last_ms: dict[str, float] = {}
+        self._started: dict[str, float] = {}
+        self.visible = False
+
+    def begin(self, name: str):
+        self._started[name] = time.perf_counter()
+
+    def end(self, name: str) -> float:
+        ms = (time.perf_counter() - self._started.pop(name)) * 1000.0
+        self.record(name, ms)
+        return ms
+
+    def record(self, name: str, ms: float):
+        self.last_ms[name] = ms
+        prev = self.avg_ms.get(name)
+        if prev is None:
+            self.avg_ms[name] = ms
+        else:
+            self.avg_ms[name] = prev + (ms - prev) * self.smoothing
+
+    def get(self, name: str) -> float:
+        return self.avg_ms.get(name, 0.0)
+
+    def toggle(self):
+        self.visible = not self.visible
+
+
+class StartupTimer:
+    """Wall time spent in each named startup step, up to the first frame."""
+
+    def __init__(self, start: float | None = None):
+        # start: perf_counter() taken as early as possible (before imports)
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.steps: list[tuple[str, float]] = []
+
+    def mark(self, name: str):
+        """Close the step that ran since the previous mark."""
+        now = time.perf_counter()
+        self.steps.append((name, (now - self.last) * 1000.0))
+        self.last = now
+
+    @property
+    def total_ms(self) -> float:
+        return (self.last - self.start) * 1000.0
+
+    def report(self) -> str:
+        steps = ", ".join(f"{name} {ms:.0f}" for name, ms in self.steps)
+        return f"startup {self.total_ms:.0f} ms ({steps})"
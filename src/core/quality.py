@@ -0,0 +1,78 @@
+# src/core/quality.py
+from config import (
+    FPS,
+    QUALITY_DROP_FRAMES,
+    QUALITY_DROP_RATIO,
+    QUALITY_RESTORE_FRAMES,
+    QUALITY_RESTORE_RATIO,
+)
+
+# what gets switched off at each level (cumulative)
+QUALITY_LEVELS = [
+    "full",
+    "no shake",
+    "no AoE fades",
+    "no damage numbers",
+    "no enemy HP bars",
+]
+
+
+class QualityController:
+    """
+    Drops cosmetic work while frames run over budget and brings it back
+    once there is headroom again.
+
+    Fed the measured work time (update + draw, without the clock sleep)
+    once per frame. Only a *sustained* overload / headroom moves the level,
+    one step at a time, so a single slow frame doesn't cause flicker.
+    """
+
+    def __init__(self, fps: int = FPS, enabled: bool = True):
+        self.budget_ms = 1000.0 / fps
+        self.enabled = enabled
+        self.level = 0
+        self.over_frames = 0
+        self.under_frames = 0
+
+    def record_frame(self, work_ms: float):
+        if not self.enabled:
+            return
+
+        if work_ms > self.budget_ms * QUALITY_DROP_RATIO:
+            self.over_frames += 1
+            self.under_frames = 0
+        elif work_ms < self.budget_ms * QUALITY_RESTORE_RATIO:
+            self.under_frames += 1
+            self.over_frames = 0
+        else:
+            self.over_frames = 0
+            self.under_frames = 0
+
+        if self.over_frames >= QUALITY_DROP_FRAMES:
+            self.over_frames = 0
+            if self.level < len(QUALITY_LEVELS) - 1:
+                self.level += 1
+        elif self.under_frames >= QUALITY_RESTORE_FRAMES:
+            self.under_frames = 0
+            if self.level > 0:
+                self.level -= 1
+
+    @property
+    def name(self) -> str:
+        return QUALITY_LEVELS[self.level]
+
+    @property
+    def show_shake(self) -> bool:
+        return self.level < 1
+
+    @property
+    def show_aoe(self) -> bool:
+        return self.level < 2
+
+    @property
+    def show_damage_numbers(self) -> bool:
+        return self.level < 3
+
+    @property
+    def show_enemy_hp_bars(self) -> bool:
+        return self.level < 4
@@ -0,0 +1,93 @@
+# src/core/render_prep.py
+"""
+Optional render prep pipeline.
+
+After each update the game captures an immutable RenderSnapshot (plain
+tuples and numbers, no live entities). A single background thread turns
+it into a PreparedFrame - HUD text surfaces and enemy HP bar rects -
+while the main thread is busy blitting the background, slots and castle
+wall (SDL blits release the GIL, so the two really overlap). The draw
+then waits for the prepared frame of the same tick, so nothing is stale.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pygame
+
+from config import FONT_PATH
+from entities.enemy import hp_bar_rect
+from ui.enemy_lod import hp_bar_mode
+
+
+@dataclass(frozen=True)
+class RenderSnapshot:
+    gold: int
+    wave_label: int
+    castle_hp: float
+    castle_max_hp: float
+    show_hp_bars: bool
+    # (x, y, hp, max_hp) per live enemy
+    enemies: tuple[tuple[float, float, float, float], ...]
+
+
+@dataclass
+class PreparedFrame:
+    gold_text: pygame.Surface
+    wave_text: pygame.Surface
+    castle_hp_text: pygame.Surface
+    hp_bar_rects: list[tuple[int, int, int, int]]
+
+
+class RenderPrep:
+    def __init__(self, font_size: int = 24):
+        # own Font object: SDL_ttf fonts must not be shared across threads
+        self.font = pygame.font.Font(FONT_PATH, font_size)
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="render-prep"
+        )
+        self.text_cache: dict[tuple[str, tuple], pygame.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def submit(self, snapshot: RenderSnapshot) -> Future:
+        return self.executor.submit(self.prepare, snapshot)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+    def _text(self, text: str, color) -> pygame.Surface:
+        key = (text, color)
+        surf = self.text_cache.get(key)
+        if surf is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if len(self.text_cache) > 256:
+                self.text_cache.clear()
+            surf = self.font.render(text, True, color)
+            self.text_cache[key] = surf
+        return surf
+
+    def prepare(self, snap: RenderSnapshot) -> PreparedFrame:
+        mode = hp_bar_mode(len(snap.enemies), snap.show_hp_bars)
+        if mode == "all":
+            bars = [hp_bar_rect(x, y, hp, max_hp) for x, y, hp, max_hp in snap.enemies]
+        elif mode == "damaged":
+            bars = [
+                hp_bar_rect(x, y, hp, max_hp)
+                for x, y, hp, max_hp in snap.enemies
+                if hp < max_hp
+            ]
+        else:
+            bars = []
+
+        return PreparedFrame(
+            gold_text=self._text(str(snap.gold), (0, 0, 0)),
+            wave_text=self._text(f"Wave {snap.wave_label}", (255, 255, 255)),
+            castle_hp_text=self._text(
+                f"Castle HP {int(snap.castle_hp)}/{int(snap.castle_max_hp)}",
+                (255, 255, 255),
+            ),
+            hp_bar_rects=bars,
+        )
@@ -0,0 +1,295 @@
+# src/core/save_state.py
+"""
+Save / load of the full game state in a small versioned binary format.
+
+Layout (little endian):
+    header   magic "CDSV", u16 version
+    globals  gold, wave, castle hp / max hp, game over flag
+    tables   slot defences, owned defences, enemies, projectiles
+             each as u32 count + fixed-size struct records
+
+Entities are packed field by field with ``struct`` (no pickle), so a
+snapshot is a few KB and restores in well under a millisecond for
+normal waves. Purely cosmetic state (damage numbers, AoE fades) is not
+saved.
+"""
+
+import struct
+
+from config import DEFENCE_TYPES
+from core.balance import get_spec
+from core.targeting import TARGETING_POLICIES
+from entities.defence import Defence
+from entities.enemy import Enemy
+from entities.projectile import Projectile
+
+MAGIC = b"CDSV"
+SAVE_VERSION = 2  # v2: slot records carry the targeting policy
+
+HEADER = struct.Struct("<4sH")
+GLOBALS = struct.Struct("<iiddB")
+COUNT = struct.Struct("<I")
+
+# present, type, level, hp, time_since_last_shot, targeting policy
+SLOT_RECORD = struct.Struct("<BBHffB")
+# v1: no targeting policy
+SLOT_RECORD_V1 = struct.Struct("<BBHff")
+# type, level
+OWNED_RECORD = struct.Struct("<BH")
+# x, y, speed, max_hp, hp, state,
+# slow_timer, slow_factor, burn_timer, burn_dps, burn_tick, stun_timer
+ENEMY_RECORD = struct.Struct("<fffffB6f")
+# x, y, start x, start y, vx, vy, damage, radius, max_distance,
+# r, g, b, crit, area_radius, source type
+PROJECTILE_RECORD = struct.Struct("<6ffHf3BBfB")
+
+ENEMY_STATES = ["moving", "attacking", "stunned"]
+# larger floats mean a corrupt file (and would overflow pygame.Rect)
+FLOAT_LIMIT = 1e7
+
+
+def _type_index(defence_type: str) -> int:
+    try:
+        return DEFENCE_TYPES.index(defence_type)
+    except ValueError:
+        return 0
+
+
+def dumps(game) -> bytes:
+    """Serialize the simulation state of ``game`` into bytes."""
+    parts = [
+        HEADER.pack(MAGIC, SAVE_VERSION),
+        GLOBALS.pack(
+            int(game.gold),
+            int(game.wave_number),
+            float(game.castle_hp),
+            float(game.castle_max_hp),
+            1 if game.is_game_over else 0,
+        ),
+    ]
+
+    # slot defences (fixed length, empty slots included)
+    parts.append(COUNT.pack(len(game.slot_defences)))
+    for d in game.slot_defences:
+        if d is None:
+            parts.append(SLOT_RECORD.pack(0, 0, 0, 0.0, 0.0, 0))
+        else:
+            parts.append(
+                SLOT_RECORD.pack(
+                    1,
+                    _type_index(d.defence_type),
+                    d.level,
+                    d.hp,
+                    d.time_since_last_shot,
+                    TARGETING_POLICIES.index(d.targeting),
+                )
+            )
+
+    parts.append(COUNT.pack(len(game.owned_defences)))
+    for dtype, level in game.owned_defences:
+        parts.append(OWNED_RECORD.pack(_type_index(dtype), level))
+
+    enemies = [e for e in game.enemies if not e.is_dead]
+    parts.append(COUNT.pack(len(enemies)))
+    pack_enemy = ENEMY_RECORD.pack
+    for e in enemies:
+        parts.append(
+            pack_enemy(
+                e.pos.x,
+                e.pos.y,
+                e.speed,
+                e.max_hp,
+                e.hp,
+                ENEMY_STATES.index(e.state) if e.state in ENEMY_STATES else 0,
+                e.slow_timer,
+                e.slow_factor,
+                e.burn_timer,
+                e.burn_dps,
+                e.burn_tick,
+                e.stun_timer,
+            )
+        )
+
+    projectiles = [p for p in game.projectiles if not p.is_dead]
+    parts.append(COUNT.pack(len(projectiles)))
+    pack_proj = PROJECTILE_RECORD.pack
+    for p in projectiles:
+        r, g, b = p.color[:3]
+        parts.append(
+            pack_proj(
+                p.pos.x,
+                p.pos.y,
+                p.start_pos.x,
+                p.start_pos.y,
+                p.velocity.x,
+                p.velocity.y,
+                p.damage,
+                p.radius,
+                p.max_distance,
+                r,
+                g,
+                b,
+                1 if p.crit else 0,
+                p.area_radius,
+                _type_index(p.source_type),
+            )
+        )
+
+    return b"".join(parts)
+
+
+def _check_floats(row: tuple) -> tuple:
+    for value in row:
+        if isinstance(value, float) and not abs(value) <= FLOAT_LIMIT:
+            raise ValueError("save data is corrupt")
+    return row
+
+
+def _unpack(record: struct.Struct, data: bytes, offset: int) -> tuple:
+    if offset + record.size > len(data):
+        raise ValueError("save data is truncated")
+    return _check_floats(record.unpack_from(data, offset))
+
+
+def _lookup(names: list, index: int):
+    """names[index] for an index read from a save (ValueError if out of range)."""
+    if index >= len(names):
+        raise ValueError("save data is corrupt")
+    return names[index]
+
+
+def _read_table(data: bytes, offset: int, record: struct.Struct):
+    (count,) = _unpack(COUNT, data, offset)
+    offset += COUNT.size
+    end = offset + count * record.size
+    if end > len(data):
+        raise ValueError("save data is truncated")
+    rows = [_check_floats(row) for row in record.iter_unpack(data[offset:end])]
+    return rows, end
+
+
+def loads(game, data: bytes):
+    """Replace the simulation state of ``game`` with the one in ``data``."""
+    if len(data) < HEADER.size:
+        raise ValueError("save data is truncated")
+
+    magic, version = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a castle defendor save")
+    if version not in (1, SAVE_VERSION):
+        raise ValueError(f"unsupported save version {version}")
+
+    offset = HEADER.size
+    gold, wave_number, castle_hp, castle_max_hp, game_over = _unpack(
+        GLOBALS, data, offset
+    )
+    offset += GLOBALS.size
+
+    slot_record = SLOT_RECORD if version >= 2 else SLOT_RECORD_V1
+    slots, offset = _read_table(data, offset, slot_record)
+    slot_defences = []
+    for present, type_idx, level, hp, since_shot, *rest in slots:
+        if not present:
+            slot_defences.append(None)
+            continue
+        d = Defence(0, 0, defence_type=_lookup(DEFENCE_TYPES, type_idx), level=level)
+        d.hp = hp
+        d.time_since_last_shot = since_shot
+        if rest:
+            d.targeting = _lookup(TARGETING_POLICIES, rest[0])
+        slot_defences.append(d)
+
+    if not slot_defences:
+        raise ValueError("save data is corrupt")
+
+    owned, offset = _read_table(data, offset, OWNED_RECORD)
+    owned_defences = [(_lookup(DEFENCE_TYPES, t), level) for t, level in owned]
+
+    enemy_rows, offset = _read_table(data, offset, ENEMY_RECORD)
+    enemies = []
+    affected = []
+    for (
+        x,
+        y,
+        speed,
+        max_hp,
+        hp,
+        state,
+        slow_timer,
+        slow_factor,
+        burn_timer,
+        burn_dps,
+        burn_tick,
+        stun_timer,
+    ) in enemy_rows:
+        e = Enemy(x, y, speed, max_hp=max_hp)
+        e.hp = hp
+        e.state = _lookup(ENEMY_STATES, state)
+        e.slow_timer = slow_timer
+        e.slow_factor = slow_factor
+        e.speed_scale = slow_factor if slow_timer > 0 else 1.0
+        e.burn_timer = burn_timer
+        e.burn_dps = burn_dps
+        e.burn_tick = burn_tick
+        e.stun_timer = stun_timer
+        if slow_timer > 0 or burn_timer > 0 or stun_timer > 0:
+            e.has_status = True
+            affected.append(e)
+        enemies.append(e)
+
+    proj_rows, offset = _read_table(data, offset, PROJECTILE_RECORD)
+    projectiles = []
+    for row in proj_rows:
+        x, y, sx, sy, vx, vy, damage, radius, max_distance = row[:9]
+        r, g, b, crit, area_radius, source_idx = row[9:]
+        source_type = _lookup(DEFENCE_TYPES, source_idx)
+        p = Projectile(
+            (sx, sy),
+            (vx, vy),
+            damage,
+            radius=radius,
+            max_distance=max_distance,
+            color=(r, g, b),
+            crit=bool(crit),
+            source_type=source_type,
+            area_radius=area_radius,
+            on_hit=get_spec(source_type).on_hit,
+        )
+        p.pos.update(x, y)
+        projectiles.append(p)
+
+    # everything parsed fine -> swap it into the game
+    game.gold = gold
+    game.wave_number = wave_number
+    game.castle_hp = castle_hp
+    game.castle_max_hp = castle_max_hp
+    game.is_game_over = bool(game_over)
+
+    # the slot table's length is the saved slot count (what-if workers
+    # start with the config count)
+    if len(slot_defences) != len(game.slot_defences):
+        game.set_slot_count(len(slot_defences))
+    game.slot_defences = slot_defences
+    game.owned_defences = owned_defences
+    game.update_defence_positions_from_slots()
+
+    game.enemies = enemies
+    game.ledger.reset(enemies)
+    game.projectiles = projectiles
+    game.status_effects.clear()
+    game.status_effects.affected.extend(affected)
+    game.damage_numbers.clear()
+    game.aoe_effects = []
+    game.beam_effects = []
+
+
+def save_game(game, path: str):
+    data = dumps(game)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def load_game(game, path: str):
+    with open(path, "rb") as f:
+        data = f.read()
+    loads(game, data)
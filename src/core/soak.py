@@ -0,0 +1,217 @@
+# src/core/soak.py
+"""
+Soak / stress mode: endless auto-played waves with leak detection.
+
+Defences are bought, placed and upgraded automatically, the castle is
+healed when it falls and the wave counter cycles at SOAK_MAX_WAVE so the
+load stays comparable over hours. Every SOAK_SAMPLE_EVERY seconds we
+record traced memory, the average tick time and how many live objects of
+each entity class exist (versus how many the game still references).
+The run fails if memory or tick time grows past the configured limits,
+or if entity objects pile up outside the game's lists.
+"""
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from config import (
+    DEFENCE_STATS,
+    DEFENCE_TYPES,
+    FPS,
+    SOAK_MAX_LEAKED_OBJECTS,
+    SOAK_MAX_MEMORY_GROWTH_MB,
+    SOAK_MAX_TICK_GROWTH,
+    SOAK_MAX_WAVE,
+    SOAK_SAMPLE_EVERY,
+    SOAK_WARMUP_SAMPLES,
+    TELEMETRY_ENABLED,
+)
+from core.what_if import Choice, apply_choice
+
+TRACKED_TYPES = (
+    "Enemy",
+    "Projectile",
+    "DamageNumber",
+    "AoeEffect",
+    "BeamEffect",
+    "Defence",
+)
+
+
+@dataclass
+class SoakSample:
+    elapsed: float
+    wave: int
+    memory_mb: float
+    tick_ms: float
+    objects: dict[str, int]
+    leaked: dict[str, int]
+
+
+@dataclass
+class SoakReport:
+    samples: list[SoakSample] = field(default_factory=list)
+    failures: list[str] = field(default_factory=list)
+    # number of samples taken when the waves first cycled back to 1; tick
+    # time is only compared once a full cycle of wave sizes has been seen
+    first_cycle_samples: int | None = None
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+
+def autoplay(game, frame: int):
+    """Keep the game going without a player. Cheap: most frames do nothing."""
+    if game.is_game_over:
+        game.castle_hp = game.castle_max_hp
+        game.is_game_over = False
+
+    if game.can_spawn_wave():
+        if game.wave_number >= SOAK_MAX_WAVE:
+            game.wave_number = 0
+        game.spawn_wave()
+
+    if frame % 30:
+        return
+
+    for i, defence in enumerate(game.slot_defences):
+        if defence is not None:
+            continue
+        if game.owned_defences:
+            apply_choice(game, Choice("place", slot_index=i, owned_index=0))
+        else:
+            dtype = DEFENCE_TYPES[frame // 30 % len(DEFENCE_TYPES)]
+            if game.gold >= DEFENCE_STATS[dtype]["shop_cost"]:
+                game.try_buy_defence(dtype)
+        return
+
+    # spend spare gold on the weakest defence
+    placed = [(d.level, i) for i, d in enumerate(game.slot_defences) if d is not None]
+    if placed:
+        _level, slot = min(placed)
+        apply_choice(game, Choice("upgrade", slot_index=slot))
+
+
+def count_objects() -> dict[str, int]:
+    counts = dict.fromkeys(TRACKED_TYPES, 0)
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in counts:
+            counts[name] += 1
+    return counts
+
+
+def referenced_objects(game) -> dict[str, int]:
+    """How many of each tracked type the game itself still holds on to."""
+    return {
+        "Enemy": len(game.enemies),
+        "Projectile": len(game.projectiles),
+        "DamageNumber": len(game.damage_numbers),
+        "AoeEffect": len(game.aoe_effects),
+        "BeamEffect": len(game.beam_effects),
+        "Defence": sum(1 for d in game.slot_defences if d is not None),
+    }
+
+
+def check(report: SoakReport):
+    if len(report.samples) <= SOAK_WARMUP_SAMPLES:
+        return
+
+    base = report.samples[SOAK_WARMUP_SAMPLES]
+    last = report.samples[-1]
+    failures = []
+
+    growth = last.memory_mb - base.memory_mb
+    if growth > SOAK_MAX_MEMORY_GROWTH_MB:
+        failures.append(f"memory grew {growth:.1f} MB since warmup")
+
+    cycle_end = report.first_cycle_samples
+    if cycle_end is not None and len(report.samples) > cycle_end:
+        # slowest window of the first cycle vs the median of the latest three
+        base_tick = max(
+            s.tick_ms for s in report.samples[SOAK_WARMUP_SAMPLES:cycle_end]
+        )
+        recent = sorted(s.tick_ms for s in report.samples[-3:])
+        recent_tick = recent[len(recent) // 2]
+        if base_tick > 0 and recent_tick > base_tick * SOAK_MAX_TICK_GROWTH:
+            failures.append(f"tick time grew {base_tick:.2f} -> {recent_tick:.2f} ms")
+
+    for name, leaked in last.leaked.items():
+        if leaked > SOAK_MAX_LEAKED_OBJECTS:
+            failures.append(f"{leaked} {name} objects alive outside the game")
+
+    report.failures = failures
+
+
+def run_soak(duration: float, headless: bool = True) -> SoakReport:
+    """Play automatically for ``duration`` wall-clock seconds and report."""
+    from core.game import Game
+
+    # unattended runs are what the metrics endpoint is for, headless or not
+    game = Game(headless=headless, telemetry=TELEMETRY_ENABLED)
+    report = SoakReport()
+    dt = 1.0 / FPS
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    next_sample = start + SOAK_SAMPLE_EVERY
+    frame = 0
+    tick_total = 0.0
+    tick_count = 0
+    prev_wave = 0
+
+    try:
+        while game.running:
+            now = time.perf_counter()
+            if now - start >= duration:
+                break
+
+            if not headless:
+                dt = game.clock.tick(FPS) / 1000.0
+
+            autoplay(game, frame)
+            if game.wave_number < prev_wave and report.first_cycle_samples is None:
+                report.first_cycle_samples = max(
+                    len(report.samples), SOAK_WARMUP_SAMPLES + 1
+                )
+            prev_wave = game.wave_number
+            t0 = time.perf_counter()
+            game.step(dt)
+            tick_total += time.perf_counter() - t0
+            tick_count += 1
+            frame += 1
+
+            if now >= next_sample:
+                next_sample = now + SOAK_SAMPLE_EVERY
+                objects = count_objects()
+                held = referenced_objects(game)
+                sample = SoakSample(
+                    elapsed=now - start,
+                    wave=game.wave_number,
+                    memory_mb=tracemalloc.get_traced_memory()[0] / (1024 * 1024),
+                    tick_ms=tick_total / max(1, tick_count) * 1000.0,
+                    objects=objects,
+                    leaked={k: objects[k] - held[k] for k in objects},
+                )
+                tick_total = 0.0
+                tick_count = 0
+
+                report.samples.append(sample)
+                print(
+                    f"[soak] {sample.elapsed:7.0f}s wave {sample.wave:3d} "
+                    f"mem {sample.memory_mb:6.2f} MB tick {sample.tick_ms:5.2f} ms "
+                    f"objects {sample.objects}"
+                )
+
+                check(report)
+                if not report.passed:
+                    break
+    finally:
+        tracemalloc.stop()
+        game.shutdown()
+
+    check(report)
+    return report
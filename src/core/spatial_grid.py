@@ -0,0 +1,146 @@
+# src/core/spatial_grid.py
+from collections import defaultdict
+
+# nearest() just checks every item up to this many
+NEAREST_SCAN_MAX = 8
+
+
+class SpatialGrid:
+    """
+    Uniform hash grid for cheap neighbour queries.
+
+    Items are bucketed by the cell their ``pos`` falls in, so a radius
+    query only looks at the few cells around the point instead of the
+    whole list. Rebuild once per tick; queries are then O(k) in the
+    number of nearby items.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self.inv_cell_size = 1.0 / self.cell_size
+        self.cells: dict[tuple[int, int], list] = defaultdict(list)
+        # (min_cx, min_cy, max_cx, max_cy) of occupied cells, for nearest()
+        self._bounds: tuple[int, int, int, int] | None = None
+        self.count = 0
+
+    def clear(self):
+        self.cells.clear()
+        self._bounds = None
+        self.count = 0
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return int(x * self.inv_cell_size // 1), int(y * self.inv_cell_size // 1)
+
+    def insert(self, item, x: float, y: float):
+        self.cells[self.cell_of(x, y)].append(item)
+        self._bounds = None
+        self.count += 1
+
+    def remove(self, item, x: float, y: float):
+        """Drop ``item`` inserted at (x, y), e.g. when it dies mid-tick."""
+        key = self.cell_of(x, y)
+        bucket = self.cells.get(key)
+        if bucket and item in bucket:
+            bucket.remove(item)
+            self.count -= 1
+            if not bucket:
+                del self.cells[key]
+
+    def rebuild(self, items):
+        """Clear and re-insert every item (anything with a ``pos`` Vector2)."""
+        cells = self.cells
+        cells.clear()
+        self._bounds = None
+        inv = self.inv_cell_size
+        count = 0
+        for item in items:
+            pos = item.pos
+            cells[(int(pos.x * inv // 1), int(pos.y * inv // 1))].append(item)
+            count += 1
+        self.count = count
+
+    def query_radius(self, x: float, y: float, radius: float):
+        """
+        Yield every item in the cells overlapping the circle (x, y, radius).
+
+        This is a broad phase: callers still do their own exact distance check.
+        """
+        inv = self.inv_cell_size
+        min_cx = int((x - radius) * inv // 1)
+        max_cx = int((x + radius) * inv // 1)
+        min_cy = int((y - radius) * inv // 1)
+        max_cy = int((y + radius) * inv // 1)
+
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def nearest(self, x: float, y: float):
+        """
+        The item whose ``pos`` is closest to (x, y), or None if the grid is empty.
+
+        Searches rings of cells outwards from the point's cell and stops
+        once nothing in the next ring could be closer than the best so far.
+        """
+        cells = self.cells
+        if not cells:
+            return None
+        if self.count <= NEAREST_SCAN_MAX:
+            # a handful of items: checking them all beats walking rings
+            return min(
+                (item for bucket in cells.values() for item in bucket),
+                key=lambda item: (item.pos.x - x) ** 2 + (item.pos.y - y) ** 2,
+            )
+        if self._bounds is None:
+            xs = [cx for cx, _cy in cells]
+            ys = [cy for _cx, cy in cells]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        min_cx, min_cy, max_cx, max_cy = self._bounds
+
+        px, py = self.cell_of(x, y)
+        # rings before first_ring miss the occupied area entirely, and past
+        # last_ring every occupied cell has been seen
+        first_ring = max(0, min_cx - px, px - max_cx, min_cy - py, py - max_cy)
+        last_ring = max(px - min_cx, max_cx - px, py - min_cy, max_cy - py)
+        cell_size = self.cell_size
+
+        best = None
+        best_sq = float("inf")
+        for ring in range(first_ring, last_ring + 1):
+            # the ring's cells, clipped to the occupied area
+            x0, x1 = max(px - ring, min_cx), min(px + ring, max_cx)
+            y0, y1 = max(py - ring + 1, min_cy), min(py + ring - 1, max_cy)
+            keys = []
+            if ring == 0:
+                keys.append((px, py))
+            else:
+                if min_cy <= py - ring <= max_cy:
+                    keys += [(cx, py - ring) for cx in range(x0, x1 + 1)]
+                if min_cy <= py + ring <= max_cy:
+                    keys += [(cx, py + ring) for cx in range(x0, x1 + 1)]
+                if min_cx <= px - ring <= max_cx:
+                    keys += [(px - ring, cy) for cy in range(y0, y1 + 1)]
+                if min_cx <= px + ring <= max_cx:
+                    keys += [(px + ring, cy) for cy in range(y0, y1 + 1)]
+
+            for key in keys:
+                bucket = cells.get(key)
+                if not bucket:
+                    continue
+                for item in bucket:
+                    pos = item.pos
+                    dx = pos.x - x
+                    dy = pos.y - y
+                    d_sq = dx * dx + dy * dy
+                    if d_sq < best_sq:
+                        best_sq = d_sq
+                        best = item
+
+            # anything in ring + 1 is at least ring cells away
+            reach = ring * cell_size
+            if best is not None and best_sq <= reach * reach:
+                break
+        return best
@@ -0,0 +1,103 @@
+# src/core/targeting.py
+from config import TARGET_GRID_CELL, TARGET_CLUSTER_RADIUS
+from core.spatial_grid import SpatialGrid
+
+# "first": closest to the castle (furthest down the field)
+# "clustered": most enemies packed around it (good for AoE)
+TARGETING_POLICIES = ["first", "strongest", "weakest", "clustered"]
+
+
+class TargetIndex:
+    """
+    Per-tick lookup structure for defence targeting.
+
+    Rebuilt once per tick from the live enemies: a spatial grid for range
+    queries plus per-cell enemy counts for the cluster score. Each defence
+    then only looks at enemies in the grid cells its range covers, instead
+    of scanning the whole enemy list.
+    """
+
+    def __init__(
+        self,
+        cell_size: float = TARGET_GRID_CELL,
+        cluster_radius: float = TARGET_CLUSTER_RADIUS,
+    ):
+        self.grid = SpatialGrid(cell_size)
+        self.cluster_size = float(cluster_radius)
+        self.cluster_counts: dict[tuple[int, int], int] = {}
+        # bounding box of the live enemies, None when there are none
+        self.bounds: tuple[float, float, float, float] | None = None
+
+    def rebuild(self, enemies):
+        alive = [e for e in enemies if not e.is_dead]
+        self.grid.rebuild(alive)
+
+        if alive:
+            xs = [e.pos.x for e in alive]
+            ys = [e.pos.y for e in alive]
+            self.bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self.bounds = None
+
+        size = self.cluster_size
+        counts: dict[tuple[int, int], int] = {}
+        for e in alive:
+            key = (int(e.pos.x // size), int(e.pos.y // size))
+            counts[key] = counts.get(key, 0) + 1
+        self.cluster_counts = counts
+
+    def cluster_score(self, enemy) -> int:
+        """Enemies in the 3x3 block of cluster cells around ``enemy``."""
+        cx = int(enemy.pos.x // self.cluster_size)
+        cy = int(enemy.pos.y // self.cluster_size)
+        counts = self.cluster_counts
+        total = 0
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                total += counts.get((x, y), 0)
+        return total
+
+    def find_target(self, pos, attack_range: float, policy: str = "first"):
+        """Best living enemy within ``attack_range`` of ``pos`` for ``policy``."""
+        px, py = pos.x, pos.y
+
+        # cheap reject: most defences of a big grid are nowhere near the wave
+        bounds = self.bounds
+        if bounds is None:
+            return None
+        min_x, min_y, max_x, max_y = bounds
+        if (
+            px + attack_range < min_x
+            or px - attack_range > max_x
+            or py + attack_range < min_y
+            or py - attack_range > max_y
+        ):
+            return None
+
+        range_sq = attack_range * attack_range
+
+        best = None
+        best_key = None
+        for enemy in self.grid.query_radius(px, py, attack_range):
+            if enemy.is_dead:
+                continue
+            dx = enemy.pos.x - px
+            dy = enemy.pos.y - py
+            if dx * dx + dy * dy > range_sq:
+                continue
+
+            if policy == "strongest":
+                key = enemy.hp
+            elif policy == "weakest":
+                key = -enemy.hp
+            elif policy == "clustered":
+                # ties go to the one closer to the castle
+                key = (self.cluster_score(enemy), enemy.pos.y)
+            else:
+                key = enemy.pos.y
+
+            if best is None or key > best_key:
+                best = enemy
+                best_key = key
+
+        return best
@@ -0,0 +1,86 @@
+# src/core/telemetry.py
+"""
+Live metrics over a tiny local HTTP endpoint (Prometheus text format).
+
+The game thread only writes numbers into a dict (``set`` is a single
+dict store, well under a microsecond). A daemon thread runs the HTTP
+server and formats whatever values are current when a scrape comes in.
+
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = "castle_"
+
+
+class Telemetry:
+    def __init__(self):
+        # (metric name, labels) -> value; labels is a tuple of (key, value)
+        self.values: dict[tuple[str, tuple], float] = {}
+        self.types: dict[str, str] = {}
+        self.server: ThreadingHTTPServer | None = None
+        self.thread: threading.Thread | None = None
+
+    # ---------- GAME THREAD ----------
+    def set(self, name: str, value: float, labels: tuple = ()):
+        self.values[(name, labels)] = value
+
+    def declare(self, name: str, metric_type: str = "gauge"):
+        """Optional: mark a metric as "counter" (default is gauge)."""
+        self.types[name] = metric_type
+
+    # ---------- SERVER THREAD ----------
+    def render(self) -> str:
+        # copy first: the game thread keeps writing while we format
+        values = dict(self.values)
+        types = dict(self.types)
+
+        lines = []
+        seen = set()
+        for (name, labels), value in sorted(values.items()):
+            full = PREFIX + name
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# TYPE {full} {types.get(name, 'gauge')}")
+            if labels:
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+                lines.append(f"{full}{{{label_text}}} {value}")
+            else:
+                lines.append(f"{full} {value}")
+        return "\n".join(lines) + "\n"
+
+    def start(self, host: str, port: int):
+        telemetry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = telemetry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # keep the game console quiet
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="telemetry", daemon=True
+        )
+        self.thread.start()
+        print(f"Telemetry on http://{host}:{self.server.server_port}/metrics")
+
+    def stop(self):
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        self.thread = None
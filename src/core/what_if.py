@@ -0,0 +1,196 @@
+# src/core/what_if.py
+"""
+What-if planning: fork the running game and play out alternative choices.
+
+The live game is snapshotted with ``save_state.dumps`` (a few KB of
+packed entity tables, cheap to copy and to send to another process),
+together with the defence stats in play, so forks use a reloaded
+balance file too. Each choice is then simulated headlessly in a worker process while the
+main loop keeps running; results are collected with ``poll``.
+"""
+
+import multiprocessing
+import os
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from config import DEFENCE_STATS
+from core import save_state
+from core.balance import apply_tables, build_specs
+
+SIM_DT = 1 / 30  # coarser than the real frame rate; good enough for planning
+SIM_MAX_SECONDS = 240.0
+
+
+@dataclass(frozen=True)
+class Choice:
+    """One option to evaluate: "none", "upgrade" or "place"."""
+
+    action: str
+    slot_index: int | None = None
+    owned_index: int | None = None
+    description: str = ""
+
+    def label(self) -> str:
+        if self.description:
+            return self.description
+        if self.action == "upgrade":
+            return f"upgrade slot {self.slot_index + 1}"
+        if self.action == "place":
+            return f"place owned #{self.owned_index} in slot {self.slot_index + 1}"
+        return "do nothing"
+
+
+@dataclass
+class ForkResult:
+    choice: Choice
+    waves_survived: int
+    castle_hp: float
+    gold: int
+    game_over: bool
+
+
+def list_choices(game) -> list[Choice]:
+    """
+    Every affordable upgrade and every owned-defence placement, plus a baseline.
+
+    Placements only go into empty slots, like the choose menu in the game.
+    """
+    choices = [Choice("none")]
+
+    for i, d in enumerate(game.slot_defences):
+        if d is not None and d.get_upgrade_cost() <= game.gold:
+            choices.append(Choice("upgrade", slot_index=i))
+
+    for owned_index, (dtype, level) in enumerate(game.owned_defences):
+        for i, d in enumerate(game.slot_defences):
+            if d is not None:
+                continue
+            choices.append(
+                Choice(
+                    "place",
+                    slot_index=i,
+                    owned_index=owned_index,
+                    description=f"place {dtype} Lv{level} in slot {i + 1}",
+                )
+            )
+
+    return choices
+
+
+def apply_choice(game, choice: Choice):
+    if choice.action == "upgrade":
+        defence = game.slot_defences[choice.slot_index]
+        cost = defence.get_upgrade_cost() if defence is not None else 0
+        if defence is not None and game.gold >= cost:
+            game.gold -= cost
+            defence.upgrade()
+    elif choice.action == "place":
+        game.place_owned_defence(choice.slot_index, choice.owned_index)
+
+
+def simulate(game, waves: int, dt: float = SIM_DT, max_seconds=SIM_MAX_SECONDS):
+    """Run ``game`` headlessly until ``waves`` more waves are cleared or it is lost."""
+    start_wave = game.wave_number
+    target_wave = start_wave + waves
+    elapsed = 0.0
+
+    while not game.is_game_over and elapsed < max_seconds:
+        if game.can_spawn_wave():
+            if game.wave_number >= target_wave:
+                break
+            game.spawn_wave()
+        game.update(dt)
+        elapsed += dt
+
+    cleared = game.wave_number - start_wave
+    if game.enemies:
+        cleared -= 1  # the current wave was not cleared
+    return max(0, cleared)
+
+
+# ---------- WORKER SIDE ----------
+_worker_game = None
+
+
+def _get_worker_game():
+    global _worker_game
+    if _worker_game is None:
+        # worker processes never open a real window or the metrics port
+        from core.game import Game
+
+        _worker_game = Game(headless=True, telemetry=False)
+    return _worker_game
+
+
+def run_fork(
+    snapshot: bytes, stats_table: dict, choice: Choice, waves: int, seed: int
+) -> ForkResult:
+    game = _get_worker_game()
+    # the live game's stats (a reloaded balance file), before any defence is built
+    if stats_table != DEFENCE_STATS:
+        apply_tables(stats_table, build_specs(stats_table))
+    save_state.loads(game, snapshot)
+    # same seed for every choice so crit rolls don't decide the comparison
+    random.seed(seed)
+
+    apply_choice(game, choice)
+    survived = simulate(game, waves)
+
+    return ForkResult(
+        choice=choice,
+        waves_survived=survived,
+        castle_hp=game.castle_hp,
+        gold=game.gold,
+        game_over=game.is_game_over,
+    )
+
+
+# ---------- MAIN SIDE ----------
+class WhatIfPlanner:
+    """Runs forks in a process pool; the caller polls once per frame."""
+
+    def __init__(self, workers: int | None = None):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.pool: ProcessPoolExecutor | None = None
+        self.pending: list[Future] = []
+
+    def is_busy(self) -> bool:
+        return bool(self.pending)
+
+    def submit(self, game, choices: list[Choice], waves: int = 3, seed: int = 1234):
+        if self.pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx)
+
+        snapshot = save_state.dumps(game)
+        stats_table = dict(DEFENCE_STATS)
+        self.pending = [
+            self.pool.submit(run_fork, snapshot, stats_table, choice, waves, seed)
+            for choice in choices
+        ]
+
+    def poll(self) -> list[ForkResult] | None:
+        """Return all results once every fork is done, else None (never blocks)."""
+        if not self.pending or not all(f.done() for f in self.pending):
+            return None
+
+        results = []
+        for f in self.pending:
+            try:
+                results.append(f.result())
+            except Exception as exc:  # a broken fork shouldn't kill the game
+                print("What-if fork failed:", exc)
+        self.pending = []
+
+        results.sort(
+            key=lambda r: (r.waves_survived, r.castle_hp, r.gold), reverse=True
+        )
+        return results
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        self.pending = []
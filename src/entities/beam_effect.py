@@ -0,0 +1,28 @@
+# entities/beam_effect.py
+import pygame
+
+
+class BeamEffect:
+    """Short-lived line(s) drawn for a hitscan shot (laser beam, lightning chain)."""
+
+    def __init__(self, points, color, width: int = 3, lifetime: float = 0.12):
+        self.points = points
+        self.color = color
+        self.width = int(width)
+        self.lifetime = lifetime
+        self.age = 0.0
+        self.dead = False
+
+    def update(self, dt: float):
+        self.age += dt
+        if self.age >= self.lifetime:
+            self.dead = True
+
+    def is_dead(self) -> bool:
+        return self.dead
+
+    def draw(self, screen: pygame.Surface):
+        # thin out as it fades
+        t = max(0.0, min(1.0, 1.0 - self.age / self.lifetime))
+        width = max(1, int(self.width * t))
+        pygame.draw.lines(screen, self.color, False, self.points, width)
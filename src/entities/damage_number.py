@@ -1,16 +1,28 @@
 import pygame
 
+from config import DAMAGE_NUMBER_MAX, DAMAGE_NUMBER_MERGE_WINDOW
+
 
 class DamageNumber:
-    def __init__(self, pos, amount, color=(255, 80, 80)):
+    def __init__(self, pos, amount, color=(255, 80, 80), target=None):
         self.pos = pygame.Vector2(pos)
         self.amount = amount
         self.color = color
+        self.target = target  # enemy this number belongs to (for merging)
         self.lifetime = 1.6
         self.age = 0.0
         self.velocity = pygame.Vector2(0, -60)
         self.alpha = 255
 
+    def merge(self, amount, color):
+        """Fold another hit into this number and restart its fade."""
+        self.amount += amount
+        # keep crit colour if any of the merged hits was a crit
+        if color != (255, 80, 80):
+            self.color = color
+        self.age = 0.0
+        self.alpha = 255
+
     def update(self, dt):
         self.age += dt
         self.pos += self.velocity * dt
@@ -22,11 +34,82 @@ class DamageNumber:
     def is_dead(self):
         return self.age >= self.lifetime or self.alpha <= 0
 
-    def draw(self, surface, font):
+    def draw(self, surface, atlas):
         if self.alpha <= 0:
             return
 
-        text_surf = font.render(str(int(self.amount)), True, self.color)
-        text_surf.set_alpha(self.alpha)
-        rect = text_surf.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-        surface.blit(text_surf, rect)
+        atlas.draw_number(
+            surface,
+            int(self.amount),
+            (int(self.pos.x), int(self.pos.y)),
+            self.color,
+            self.alpha,
+        )
+
+
+class DamageNumbers:
+    """
+    All live damage numbers.
+
+    Hits on the same enemy within ``merge_window`` seconds add up into one
+    number instead of stacking new ones, and at most ``max_numbers`` are
+    kept alive (oldest dropped first), so big AoE bursts stay cheap.
+    """
+
+    def __init__(
+        self,
+        merge_window: float = DAMAGE_NUMBER_MERGE_WINDOW,
+        max_numbers: int = DAMAGE_NUMBER_MAX,
+    ):
+        self.merge_window = merge_window
+        self.max_numbers = max_numbers
+        self.numbers: list[DamageNumber] = []  # spawn order, oldest first
+        self.by_target: dict[int, DamageNumber] = {}
+
+    def add(self, pos, amount, color=(255, 80, 80), target=None):
+        if target is not None:
+            existing = self.by_target.get(id(target))
+            if (
+                existing is not None
+                and existing.target is target
+                and existing.age <= self.merge_window
+            ):
+                existing.merge(amount, color)
+                return existing
+
+        dn = DamageNumber(pos, amount, color, target)
+        self.numbers.append(dn)
+        if target is not None:
+            self.by_target[id(target)] = dn
+
+        excess = len(self.numbers) - self.max_numbers
+        if excess > 0:
+            for old in self.numbers[:excess]:
+                self._forget(old)
+            del self.numbers[:excess]
+
+        return dn
+
+    def update(self, dt):
+        alive = []
+        for dn in self.numbers:
+            dn.update(dt)
+            if dn.is_dead():
+                self._forget(dn)
+            else:
+                alive.append(dn)
+        self.numbers = alive
+
+    def clear(self):
+        self.numbers.clear()
+        self.by_target.clear()
+
+    def _forget(self, dn: DamageNumber):
+        if dn.target is not None and self.by_target.get(id(dn.target)) is dn:
+            del self.by_target[id(dn.target)]
+
+    def __iter__(self):
+        return iter(self.numbers)
+
+    def __len__(self):
+        return len(self.numbers)
@@ -2,7 +2,8 @@ import pygame
 import random
 
 from entities.projectile import Projectile
-from config import DEFENCE_STATS
+from core.balance import DefenceSpec, get_spec
+from core.combat_stats import DefenceStats
 
 
 class Defence:
@@ -11,22 +12,16 @@ class Defence:
         self.defence_type = defence_type
         self.level = level
 
-        stats = DEFENCE_STATS[defence_type]
-
-        self.base_damage = stats["damage"]
-        self.base_range = stats["range"]
-
-        self.base_cooldown = stats["cooldown"]
-        self.base_projectile_speed = stats["proj_speed"]
-        self.projectile_color = stats["color"]
-        self.base_cost = stats["base_cost"]
-        self.crit_chance = stats["crit_chance"]
-        self.crit_multiplier = stats["crit_multiplier"]
+        spec = get_spec(defence_type)
+        self.max_hp = spec.max_hp
+        self.hp = self.max_hp
+        self.apply_spec(spec)
+        self.targeting = spec.targeting
 
         self.time_since_last_shot = 0.0
 
-        self.max_hp = stats.get("max_hp", 50)
-        self.hp = self.max_hp
+        # shots / hits / damage / kills... (see core.combat_stats)
+        self.stats = DefenceStats()
 
         self.size = 32
         self.rect = pygame.Rect(0, 0, self.size, self.size)
@@ -37,6 +32,31 @@ class Defence:
         self.shake_duration = 0.12  # seconds
         self.shake_magnitude = 2  # pixels (used in UI)
 
+    def apply_spec(self, spec: DefenceSpec):
+        """Copy this type's numbers in (on creation and after a balance reload)."""
+        self.base_damage = spec.damage
+        self.base_range = spec.range
+
+        self.base_cooldown = spec.cooldown
+        self.base_projectile_speed = spec.proj_speed
+        self.projectile_color = spec.color
+        self.base_cost = spec.base_cost
+        self.crit_chance = spec.crit_chance
+        self.crit_multiplier = spec.crit_multiplier
+        self.on_hit = spec.on_hit
+
+        # "projectile", or an instant kind resolved by core.hitscan
+        self.attack = spec.attack
+        self.chain_count = spec.chain_count
+        self.chain_range = spec.chain_range
+        self.chain_falloff = spec.chain_falloff
+        self.beam_width = spec.beam_width
+
+        # keep the same share of health if max HP changed
+        if spec.max_hp != self.max_hp and self.max_hp > 0:
+            self.hp = self.hp / self.max_hp * spec.max_hp
+        self.max_hp = spec.max_hp
+
     def take_damage(self, amount: float):
         self.hp = max(0.0, self.hp - amount)
 
@@ -62,7 +82,9 @@ class Defence:
     def get_upgrade_cost(self) -> int:
         return int(self.base_cost * self.level)
 
-    def update(self, dt, enemies, projectiles):
+    def update(self, dt, enemies, projectiles, targets=None, shots=None):
+        self.stats.time += dt
+
         # decay shake timer every frame
         if self.shake_time > 0:
             self.shake_time = max(0.0, self.shake_time - dt)
@@ -72,46 +94,68 @@ class Defence:
         if self.time_since_last_shot < self.base_cooldown:
             return
 
-        # find enemy in range
+        # find enemy in range (targets: per-tick TargetIndex from Game)
         target = None
-        for enemy in enemies:
-            if enemy.is_dead:
-                continue
-            if self.pos.distance_to(enemy.pos) <= self.base_range:
-                target = enemy
-                break
+        if targets is not None:
+            target = targets.find_target(self.pos, self.base_range, self.targeting)
+        else:
+            for enemy in enemies:
+                if enemy.is_dead:
+                    continue
+                if self.pos.distance_to(enemy.pos) <= self.base_range:
+                    target = enemy
+                    break
 
         if target is None:
             return
 
-        # fire projectile
-        direction = target.pos - self.pos
-        if direction.length_squared() == 0:
+        # shots: Game aims every defence's shot for this tick in one batch
+        # (instant kinds are only resolved there)
+        if shots is not None:
+            shots.append((self, target))
+            return
+        if self.attack != "projectile":
             return
 
+        projectile = self.fire(target.pos.x - self.pos.x, target.pos.y - self.pos.y)
+        if projectile is not None:
+            projectiles.append(projectile)
+
+    def fire(self, dx: float, dy: float):
+        """Spawn a projectile heading along (dx, dy) and restart the cooldown."""
+        direction = pygame.Vector2(dx, dy)
+        if direction.length_squared() == 0:
+            return None
+
         direction = direction.normalize()
         velocity = direction * self.base_projectile_speed
 
         is_crit = random.random() < self.crit_chance
         dmg = self.base_damage * (self.crit_multiplier if is_crit else 1.0)
 
+        self.stats.shots += 1
+        if is_crit:
+            self.stats.crits += 1
+
         aoe_radius = 60 if self.defence_type == "mage" else 0.0
 
-        projectiles.append(
-            Projectile(
-                self.pos,
-                velocity,
-                dmg,
-                max_distance=self.base_range,
-                color=self.projectile_color,
-                crit=is_crit,
-                area_radius=aoe_radius,
-            )
+        projectile = Projectile(
+            self.pos,
+            velocity,
+            dmg,
+            max_distance=self.base_range,
+            color=self.projectile_color,
+            crit=is_crit,
+            source_type=self.defence_type,
+            area_radius=aoe_radius,
+            on_hit=self.on_hit,
+            source=self,
         )
 
         # reset cooldown and start shake
         self.time_since_last_shot = 0.0
         self.shake_time = self.shake_duration
+        return projectile
 
     def draw(self, screen):
         # just HP bar (no square; icons are drawn in UI slots)
@@ -1,9 +1,43 @@
 # src/entities/enemy.py
+import itertools
+
 import pygame
 from config import ENEMY_SIZE
+from ui.enemy_sprites import get_enemy_frame
+
+HP_BAR_COLOR = (0, 220, 0)
+# hands out walk-cycle phases (not random: what-if runs seed the global RNG)
+_phases = itertools.count()
+# plain-rect fallback when the sprites aren't loaded
+BODY_COLORS = {
+    "normal": (200, 50, 50),
+    "slowed": (130, 90, 220),
+    "stunned": (230, 210, 90),
+}
+
+
+def hp_bar_rect(x: float, y: float, hp: float, max_hp: float) -> tuple:
+    """Rect of the HP bar above an enemy at (x, y) (shared with render prep)."""
+    bar_width = 30
+    bar_height = 4
+    offset_y = -14
+
+    if max_hp > 0:
+        ratio = max(0.0, hp / max_hp)
+    else:
+        ratio = 0.0
+
+    return (
+        int(x - bar_width / 2),
+        int(y + offset_y),
+        int(bar_width * ratio),
+        bar_height,
+    )
 
 
 class Enemy:
+    archetype = "goblin"  # sprite set / animation clock (ui.enemy_sprites)
+
     def __init__(self, x, y, speed, max_hp=30):
         self.pos = pygame.Vector2(x, y)
         self.speed = speed
@@ -16,6 +50,26 @@ class Enemy:
         self.size = 24
         self.rect = pygame.Rect(0, 0, self.size, self.size)
         self.rect.center = (int(self.pos.x), int(self.pos.y))
+        # px/s from the last update, used by defences to lead their shots
+        self.velocity = pygame.Vector2()
+        # sprite direction, kept while standing still
+        self.facing = "down"
+        # offset into the archetype's shared walk cycle so crowds don't march in step
+        self.anim_phase = next(_phases) % 4
+
+        # status effects (ticked by StatusEffects in one batched pass)
+        self.has_status = False
+        self.speed_scale = 1.0
+        self.slow_timer = 0.0
+        self.slow_factor = 1.0
+        self.burn_timer = 0.0
+        self.burn_dps = 0.0
+        self.burn_tick = 0.0
+        self.stun_timer = 0.0
+        self.burn_source = None  # Defence whose burn is ticking
+
+        # CombatLedger this enemy reports damage / death to (set by Game)
+        self.ledger = None
 
     def get_rect(self):
         rect = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
@@ -26,6 +80,12 @@ class Enemy:
         if self.is_dead:
             return
 
+        # stunned enemies neither move nor attack
+        if self.stun_timer > 0:
+            self.state = "stunned"
+            self.velocity.update(0, 0)
+            return
+
         # --- move toward target center (both X and Y) ---
         tx, ty = target_rect.center
         dx = tx - self.pos.x
@@ -37,45 +97,60 @@ class Enemy:
         # close enough to attack?
         if dist_sq <= self.attack_range * self.attack_range:
             self.state = "attacking"
+            self.velocity.update(0, 0)
             # when attacking, we don't move; Game will apply damage
         else:
             self.state = "moving"
             dist = dist_sq**0.5
             if dist > 0:
                 # normalized direction
-                self.pos.x += (dx / dist) * self.speed * dt
-                self.pos.y += (dy / dist) * self.speed * dt
+                speed = self.speed * self.speed_scale
+                self.velocity.update(dx / dist * speed, dy / dist * speed)
+                if abs(dx) > abs(dy):
+                    self.facing = "right" if dx > 0 else "left"
+                else:
+                    self.facing = "down" if dy > 0 else "up"
+                self.pos.x += self.velocity.x * dt
+                self.pos.y += self.velocity.y * dt
 
         # sync rect to pos for rendering/collision
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
-    def take_damage(self, amount: float):
+    def take_damage(self, amount: float, source=None):
+        if self.is_dead:
+            return
+        dealt = min(amount, self.hp)
         self.hp -= amount
+        if self.ledger is not None:
+            self.ledger.damage(self, dealt, source)
         if self.hp <= 0:
             self.is_dead = True
+            if self.ledger is not None:
+                self.ledger.death(self, source, amount - dealt)
 
-    def draw(self, screen):
-        # --- enemy body ---
-        pygame.draw.rect(screen, (200, 50, 50), self.rect)
-
-        # --- HP BAR ABOVE ENEMY ---
-        bar_width = 30
-        bar_height = 4
-        offset_y = -14
-
-        x = int(self.pos.x - bar_width / 2)
-        y = int(self.pos.y + offset_y)
-
-        # pygame.draw.rect(screen, (80, 0, 0), (x, y, bar_width, bar_height))
+    def draw(self, screen, show_hp_bar: bool = True):
+        # --- enemy body (tinted while stunned / slowed) ---
+        if self.stun_timer > 0:
+            tint = "stunned"
+        elif self.slow_timer > 0:
+            tint = "slowed"
+        else:
+            tint = "normal"
 
-        if self.max_hp > 0:
-            ratio = max(0.0, self.hp / self.max_hp)
+        frame = get_enemy_frame(self.archetype, self.facing, tint, self.anim_phase)
+        if frame is not None:
+            sprite, (ox, oy) = frame
+            x, y = self.rect.center
+            screen.blit(sprite, (x + ox, y + oy))
         else:
-            ratio = 0.0
+            pygame.draw.rect(screen, BODY_COLORS[tint], self.rect)
 
-        # enemy hp bar
+        if not show_hp_bar:
+            return
+
+        # --- HP BAR ABOVE ENEMY ---
         pygame.draw.rect(
             screen,
-            (0, 220, 0),
-            (x, y, int(bar_width * ratio), bar_height),
+            HP_BAR_COLOR,
+            hp_bar_rect(self.pos.x, self.pos.y, self.hp, self.max_hp),
         )
@@ -1,5 +1,4 @@
 import pygame
-from entities.damage_number import DamageNumber
 from entities.aoe_effect import AoeEffect  # <-- make sure this file/class exists
 
 
@@ -15,6 +14,8 @@ class Projectile:
         crit=False,
         source_type: str = "archer",
         area_radius: float = 0.0,
+        on_hit=None,
+        source=None,
     ):
         self.pos = pygame.Vector2(pos)
         self.start_pos = pygame.Vector2(pos)
@@ -27,13 +28,18 @@ class Projectile:
         self.crit = crit
         self.area_radius = area_radius
         self.source_type = source_type
+        self.on_hit = on_hit  # OnHitEffects or None
+        self.source = source  # Defence that fired it (None after loading)
+        self.hit = False  # did it damage anything before dying
+        self.ticks = 0  # updates spent in flight
 
-    def update(self, dt, enemies, damage_numbers, aoe_effects):
+    def update(self, dt, enemies, damage_numbers, aoe_effects, status_effects=None):
         if self.is_dead:
             return
 
         # move
         self.pos += self.velocity * dt
+        self.ticks += 1
 
         # remove projectile if it travels too far
         if self.pos.distance_to(self.start_pos) >= self.max_distance:
@@ -67,14 +73,17 @@ class Projectile:
                 dist_sq = dx * dx + dy * dy  # correct distance squared
 
                 if dist_sq <= self.area_radius * self.area_radius:
-                    enemy.take_damage(self.damage)
+                    enemy.take_damage(self.damage, self.source)
+                    if self.source is not None:
+                        self.source.stats.hits += 1
+                    if self.on_hit is not None and status_effects is not None:
+                        status_effects.apply(enemy, self.on_hit, self.source)
 
                     enemy_rect = enemy.get_rect()
                     color = (255, 255, 0) if self.crit else (255, 80, 80)
-                    damage_numbers.append(
-                        DamageNumber(enemy_rect.midtop, self.damage, color)
-                    )
+                    damage_numbers.add(enemy_rect.midtop, self.damage, color, enemy)
 
+            self.hit = True
             self.is_dead = True
             return
 
@@ -83,14 +92,17 @@ class Projectile:
             if enemy.is_dead:
                 continue
             if enemy.get_rect().collidepoint(self.pos.x, self.pos.y):
-                enemy.take_damage(self.damage)
+                enemy.take_damage(self.damage, self.source)
+                if self.source is not None:
+                    self.source.stats.hits += 1
+                if self.on_hit is not None and status_effects is not None:
+                    status_effects.apply(enemy, self.on_hit, self.source)
 
                 enemy_rect = enemy.get_rect()
                 color = (255, 255, 0) if self.crit else (255, 80, 80)
 
-                damage_numbers.append(
-                    DamageNumber(enemy_rect.midtop, self.damage, color)
-                )
+                damage_numbers.add(enemy_rect.midtop, self.damage, color, enemy)
+                self.hit = True
                 self.is_dead = True
                 break
 
@@ -0,0 +1,116 @@
+# src/entities/status_effects.py
+from dataclasses import dataclass
+
+BURN_TICK = 0.5  # seconds between burn damage numbers
+BURN_COLOR = (255, 140, 0)
+
+
+@dataclass(frozen=True)
+class OnHitEffects:
+    """Status effects a defence's projectiles apply on hit (built once per defence)."""
+
+    slow_factor: float = 1.0
+    slow_duration: float = 0.0
+    burn_dps: float = 0.0
+    burn_duration: float = 0.0
+    stun_duration: float = 0.0
+
+    @classmethod
+    def from_stats(cls, stats: dict) -> "OnHitEffects | None":
+        effects = cls(
+            slow_factor=stats.get("slow_factor", 1.0),
+            slow_duration=stats.get("slow_duration", 0.0),
+            burn_dps=stats.get("burn_dps", 0.0),
+            burn_duration=stats.get("burn_duration", 0.0),
+            stun_duration=stats.get("stun_duration", 0.0),
+        )
+        if (
+            effects.slow_duration <= 0
+            and effects.burn_duration <= 0
+            and effects.stun_duration <= 0
+        ):
+            return None
+        return effects
+
+
+class StatusEffects:
+    """
+    Slow / burn / stun for all enemies.
+
+    Effect state lives in plain timer fields on each Enemy (no object per
+    effect). Only enemies with something active are kept in ``affected``,
+    and ``update`` ticks all of them in one pass per frame.
+    """
+
+    def __init__(self):
+        self.affected: list = []
+
+    def apply(self, enemy, effects: OnHitEffects, source=None):
+        if enemy.is_dead:
+            return
+
+        if effects.slow_duration > 0:
+            if enemy.slow_timer > 0:
+                # keep the strongest slow, refresh the longest duration
+                enemy.slow_factor = min(enemy.slow_factor, effects.slow_factor)
+            else:
+                enemy.slow_factor = effects.slow_factor
+            enemy.slow_timer = max(enemy.slow_timer, effects.slow_duration)
+            enemy.speed_scale = enemy.slow_factor
+
+        if effects.burn_duration > 0:
+            enemy.burn_dps = max(enemy.burn_dps, effects.burn_dps)
+            enemy.burn_timer = max(enemy.burn_timer, effects.burn_duration)
+            enemy.burn_source = source
+
+        if effects.stun_duration > 0:
+            enemy.stun_timer = max(enemy.stun_timer, effects.stun_duration)
+
+        if not enemy.has_status:
+            enemy.has_status = True
+            self.affected.append(enemy)
+
+    def update(self, dt: float, damage_numbers):
+        still_affected = []
+
+        for enemy in self.affected:
+            if enemy.is_dead:
+                enemy.has_status = False
+                continue
+
+            if enemy.stun_timer > 0:
+                enemy.stun_timer = max(0.0, enemy.stun_timer - dt)
+
+            if enemy.slow_timer > 0:
+                enemy.slow_timer -= dt
+                if enemy.slow_timer <= 0:
+                    enemy.slow_timer = 0.0
+                    enemy.slow_factor = 1.0
+                enemy.speed_scale = enemy.slow_factor
+
+            if enemy.burn_timer > 0:
+                step = min(dt, enemy.burn_timer)
+                enemy.burn_timer -= step
+                enemy.burn_tick += step
+
+                if enemy.burn_tick >= BURN_TICK or enemy.burn_timer <= 0:
+                    dmg = enemy.burn_dps * enemy.burn_tick
+                    enemy.burn_tick = 0.0
+                    enemy.take_damage(dmg, enemy.burn_source)
+                    damage_numbers.add(enemy.get_rect().midtop, dmg, BURN_COLOR, enemy)
+
+                if enemy.burn_timer <= 0:
+                    enemy.burn_timer = 0.0
+                    enemy.burn_dps = 0.0
+
+            if (
+                enemy.stun_timer > 0 or enemy.slow_timer > 0 or enemy.burn_timer > 0
+            ) and not enemy.is_dead:
+                still_affected.append(enemy)
+            else:
+                enemy.has_status = False
+
+        self.affected = still_affected
+
+    def clear(self):
+        self.affected.clear()
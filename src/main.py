@@ -1,11 +1,65 @@
 # src/main.py
+import time
+
+# taken before the heavy imports so the startup report includes them
+STARTED = time.perf_counter()
+
+import argparse
+import sys
+
 from core.game import Game
+from core.profiler import StartupTimer
 
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description="CastleDefend0r")
+    parser.add_argument(
+        "--soak",
+        type=float,
+        metavar="SECONDS",
+        help="auto-play for SECONDS and check for leaks / slowdowns",
+    )
+    parser.add_argument(
+        "--windowed", action="store_true", help="show the window during --soak"
+    )
+    parser.add_argument(
+        "--build-atlas",
+        action="store_true",
+        help="rebuild the sprite atlas file from the PNGs and exit",
+    )
+    args = parser.parse_args()
+
+    if args.build_atlas:
+        from config import ATLAS_PATH
+        from ui.atlas import rebuild_atlas_file
+
+        rebuild_atlas_file(ATLAS_PATH)
+        return
+
+    if args.soak is not None:
+        from core.soak import run_soak
+
+        report = run_soak(args.soak, headless=not args.windowed)
+        if not report.passed:
+            for failure in report.failures:
+                print("[soak] FAIL:", failure)
+            sys.exit(1)
+        print("[soak] OK")
+        return
+
+    startup = StartupTimer(STARTED)
+    startup.mark("imports")
+    game = Game(startup=startup)
     game.run()
 
 
+async def main_async():
+    """Entry point for embedding the game in an asyncio program (or pygbag)."""
+    startup = StartupTimer(STARTED)
+    startup.mark("imports")
+    game = Game(startup=startup)
+    await game.run_async()
+
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,12 @@
 import pygame
-from config import WIDTH, HEIGHT
+from ui.assets import load_sprite
+
+ICON_SIZE = (80, 80)  # how big icons will be drawn
+SHOP_ICON_PATH = "assets/ui/icon_shop.png"
+GOLD_ICON_PATH = "assets/ui/icon_gold.png"
+NEXT_WAVE_ICON_PATH = "assets/ui/icon_next_wave.png"
+TOP_MARGIN = 90  # px from the top of the screen to the bar
+LABEL_HEIGHT = 30  # px left for the wave label under the last icon
 
 
 class ActionBar:
@@ -9,36 +16,37 @@ class ActionBar:
 
         # === Container ===
         self.hotbar_container_color = (255, 255, 0)
-        hotbar_container_size = pygame.Vector2(60, 180)
-
-        x = WIDTH - hotbar_container_size.x - 20
-        y = HEIGHT - hotbar_container_size.y - 450
-
-        self.hotbar_container = pygame.Rect(
-            x, y, hotbar_container_size.x, hotbar_container_size.y
-        )
+        self.hotbar_container_size = pygame.Vector2(60, 180)
+        self.hotbar_container = self._container_rect(screen.get_size())
 
         # === Icon layout ===
-        self.icon_size = (80, 80)  # how big icons will be drawn
+        self.icon_size = ICON_SIZE
         self.icon_spacing = 10
 
-        # === Load icon images ===
-        # (change paths/names to match your actual files)
-        self.img_shop = pygame.image.load("assets/ui/icon_shop.png").convert_alpha()
-        self.img_gold = pygame.image.load("assets/ui/icon_gold.png").convert_alpha()
-        self.img_next = pygame.image.load(
-            "assets/ui/icon_next_wave.png"
-        ).convert_alpha()
-
-        # Scale icons to a consistent size
-        self.img_shop = pygame.transform.scale(self.img_shop, self.icon_size)
-        self.img_gold = pygame.transform.scale(self.img_gold, self.icon_size)
-        self.img_next = pygame.transform.scale(self.img_next, self.icon_size)
+        # === Load icon images (scaled, from the sprite atlas if built) ===
+        self.img_shop = load_sprite(SHOP_ICON_PATH, self.icon_size)
+        self.img_gold = load_sprite(GOLD_ICON_PATH, self.icon_size)
+        self.img_next = load_sprite(NEXT_WAVE_ICON_PATH, self.icon_size)
 
         # === Build icon rects & metadata ===
         self.icons = []
         self._create_icons()
 
+    def _container_rect(self, screen_size: tuple[int, int]) -> pygame.Rect:
+        # right edge, TOP_MARGIN from the top; pulled up on short windows so
+        # the icon column (and the wave label under it) stays on screen
+        size = self.hotbar_container_size
+        x = screen_size[0] - size.x - 20
+        column_height = 10 + 3 * ICON_SIZE[1] + 2 * 10 + LABEL_HEIGHT
+        y = max(0, min(TOP_MARGIN, screen_size[1] - column_height))
+        return pygame.Rect(x, y, size.x, size.y)
+
+    def relayout(self, screen_size: tuple[int, int]):
+        """Re-anchor the bar to the right edge after a resize."""
+        self.hotbar_container = self._container_rect(screen_size)
+        self.icons = []
+        self._create_icons()
+
     def _create_icons(self):
         """Create rects & metadata for shop, gold, next wave icons."""
         cx = self.hotbar_container.x + 10
@@ -86,7 +94,14 @@ class ActionBar:
         return None
 
     # ---------- DRAW ----------
-    def draw(self, gold, wave_number: int):
+    def draw(
+        self,
+        gold,
+        wave_number: int,
+        gold_surf: pygame.Surface | None = None,
+        wave_surf: pygame.Surface | None = None,
+    ):
+        """Draw the icons; text surfaces may come pre-rendered from render prep."""
 
         # Draw all icons
         for icon in self.icons:
@@ -96,7 +111,9 @@ class ActionBar:
 
             # Gold text under gold icon
             if icon["name"] == "gold":
-                text_surf = self.font.render(str(gold), True, (0, 0, 0))
+                text_surf = gold_surf
+                if text_surf is None:
+                    text_surf = self.font.render(str(gold), True, (0, 0, 0))
                 text_rect = text_surf.get_rect(midtop=(rect.centerx, rect.bottom + 2))
                 self.screen.blit(text_surf, text_rect)
 
@@ -104,8 +121,10 @@ class ActionBar:
         next_icon = next(i for i in self.icons if i["name"] == "next_wave")
         next_rect = next_icon["rect"]
 
-        label_text = f"Wave {wave_number}"
-        label_surf = self.font.render(label_text, True, (255, 255, 255))
+        label_surf = wave_surf
+        if label_surf is None:
+            label_text = f"Wave {wave_number}"
+            label_surf = self.font.render(label_text, True, (255, 255, 255))
 
         label_rect = label_surf.get_rect(
             center=(next_rect.centerx, next_rect.bottom + 12)
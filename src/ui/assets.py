@@ -0,0 +1,156 @@
+# src/ui/assets.py
+import os
+import threading
+
+import pygame
+
+# scaled copies of images, keyed by (source surface id, size, smooth)
+_scaled_cache: dict[tuple[int, tuple[int, int], bool], tuple] = {}
+# translucent full-screen overlays, keyed by (size, rgba)
+_overlay_cache: dict[
+    tuple[tuple[int, int], tuple[int, int, int, int]], pygame.Surface
+] = {}
+
+# decoded + converted images waiting to be picked up, keyed by (path, alpha)
+_preloaded: dict[tuple[str, bool], pygame.Surface] = {}
+# ui.atlas.Atlas sprites are served from, once Game has installed one
+_atlas = None
+# images load_sprite shrinks with smoothscale (detailed art drawn small)
+_smooth_paths: set[str] = set()
+
+# hit / miss counters per cache (read by telemetry)
+cache_stats = {"scaled": [0, 0], "overlay": [0, 0]}
+
+
+def preload_images(images: list[tuple[str, bool]]):
+    """
+    Decode the (path, alpha) images needed for the first frame up front.
+
+    PNG decoding is most of the startup time and pygame releases the GIL
+    while it decodes, so on a multi-core machine the files are split over a
+    few threads. convert() / convert_alpha() then run here, on the thread
+    that owns the display.
+    """
+    paths = [path for path, _alpha in images]
+    decoded: dict[str, pygame.Surface] = {}
+
+    def worker(chunk):
+        for path in chunk:
+            decoded[path] = pygame.image.load(path)
+
+    workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        worker(paths)
+    else:
+        threads = [
+            threading.Thread(target=worker, args=(paths[i::workers],))
+            for i in range(workers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    for path, alpha in images:
+        image = decoded.get(path)
+        if image is None:
+            continue  # failed in a worker: load_image() retries and raises
+        _preloaded[(path, alpha)] = image.convert_alpha() if alpha else image.convert()
+
+
+def load_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """
+    Load and convert ``path``, or hand over the copy ``preload_images`` made.
+
+    Preloaded images are handed out once; callers keep their own reference
+    (usually a scaled copy), so the full-size original can be freed.
+    """
+    image = _preloaded.pop((path, alpha), None)
+    if image is None:
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+    return image
+
+
+def sprite_key(path: str, size: tuple[int, int] | None = None) -> str:
+    """Name of an image at a given draw size (its atlas lookup key)."""
+    if size is None:
+        return path
+    return f"{path}@{int(size[0])}x{int(size[1])}"
+
+
+def smooth_scale(*paths: str):
+    """Have ``load_sprite`` smoothscale these images instead of scaling."""
+    _smooth_paths.update(paths)
+
+
+def install_atlas(atlas):
+    global _atlas
+    _atlas = atlas
+
+
+def load_sprite(
+    path: str,
+    size: tuple[int, int] | None = None,
+    alpha: bool = True,
+) -> pygame.Surface:
+    """
+    ``path`` at ``size`` (or its own size), ready to blit.
+
+    Comes straight out of the installed sprite atlas when it is there
+    (opaque images get their own converted copy for faster blits),
+    otherwise it is loaded from the file and scaled.
+    """
+    if _atlas is not None:
+        sprite = _atlas.get(sprite_key(path, size))
+        if sprite is not None:
+            return sprite if alpha else sprite.convert()
+
+    image = load_image(path, alpha)
+    if size is not None and image.get_size() != tuple(size):
+        if path in _smooth_paths:
+            image = pygame.transform.smoothscale(image, size)
+        else:
+            image = pygame.transform.scale(image, size)
+    return image
+
+
+def get_scaled(
+    image: pygame.Surface, size: tuple[int, int], smooth: bool = True
+) -> pygame.Surface:
+    """
+    Return ``image`` scaled to ``size``, scaling only the first time.
+
+    Used on resize, so flipping between a few window sizes never scales
+    the same image twice.
+    """
+    size = (max(1, int(size[0])), max(1, int(size[1])))
+    key = (id(image), size, smooth)
+
+    entry = _scaled_cache.get(key)
+    # keep a ref to the source so its id can't be reused while cached
+    if entry is None or entry[0] is not image:
+        cache_stats["scaled"][1] += 1
+        if smooth:
+            scaled = pygame.transform.smoothscale(image, size)
+        else:
+            scaled = pygame.transform.scale(image, size)
+        entry = (image, scaled)
+        _scaled_cache[key] = entry
+    else:
+        cache_stats["scaled"][0] += 1
+    return entry[1]
+
+
+def get_overlay(size: tuple[int, int], rgba=(0, 0, 0, 160)) -> pygame.Surface:
+    """Cached translucent overlay covering ``size`` (popups, game over)."""
+    key = (tuple(size), tuple(rgba))
+    overlay = _overlay_cache.get(key)
+    if overlay is not None:
+        cache_stats["overlay"][0] += 1
+    else:
+        cache_stats["overlay"][1] += 1
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill(rgba)
+        _overlay_cache[key] = overlay
+    return overlay
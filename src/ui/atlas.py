@@ -0,0 +1,184 @@
+# src/ui/atlas.py
+"""
+Sprite atlas: every game / UI image at the size it is drawn, packed into
+one surface and saved as a single prebuilt file.
+
+Layout (little endian):
+    header   magic "CDAT", u16 version, u16 width, u16 height,
+             u32 table length
+    table    JSON: sprite key -> [x, y, w, h], source path -> mtime
+    pixels   zlib-compressed RGBA of the whole page
+
+Game loads it with one read at startup instead of decoding a dozen large
+PNGs; sprites are subsurfaces of the page (``Atlas.get``). A missing or
+stale atlas (a source PNG changed, or the sprite list did) is rebuilt
+from the PNGs and written again, or build it up front with
+
+    python src/main.py --build-atlas
+"""
+
+import json
+import os
+import struct
+import zlib
+
+import pygame
+
+from ui import action_bar
+from ui.assets import load_sprite, preload_images, sprite_key
+from ui.enemy_sprites import enemy_sprites
+from ui.slots import DEFENCE_ICON_PATHS, ICON_SIZE, SLOT_ICON_PATH
+
+MAGIC = b"CDAT"
+ATLAS_VERSION = 1
+HEADER = struct.Struct("<4sHHHI")
+PADDING = 2  # px between sprites
+
+
+def atlas_sprites() -> list[tuple[str, tuple[int, int] | None]]:
+    """(path, draw size or None for the file's own size) of every sprite."""
+    sprites = [
+        ("assets/fields.png", None),
+        ("assets/castle_wall_img.png", None),
+        (SLOT_ICON_PATH, ICON_SIZE),
+    ]
+    sprites += [(path, ICON_SIZE) for path in DEFENCE_ICON_PATHS.values()]
+    sprites += [
+        (path, action_bar.ICON_SIZE)
+        for path in (
+            action_bar.SHOP_ICON_PATH,
+            action_bar.GOLD_ICON_PATH,
+            action_bar.NEXT_WAVE_ICON_PATH,
+        )
+    ]
+    sprites += enemy_sprites()
+    return sprites
+
+
+class Atlas:
+    def __init__(self, page: pygame.Surface, rects: dict[str, pygame.Rect]):
+        self.page = page
+        self.rects = rects
+        self.sprites: dict[str, pygame.Surface] = {}
+
+    def get(self, key: str) -> pygame.Surface | None:
+        """Subsurface for ``key`` (see ``ui.assets.sprite_key``), or None."""
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            rect = self.rects.get(key)
+            if rect is None:
+                return None
+            sprite = self.page.subsurface(rect)
+            self.sprites[key] = sprite
+        return sprite
+
+
+def pack(sizes: dict[str, tuple[int, int]]) -> tuple[dict[str, pygame.Rect], int, int]:
+    """Shelf packing, tallest first, into a page as wide as the widest sprite."""
+    page_width = max(w for w, _h in sizes.values())
+    rects: dict[str, pygame.Rect] = {}
+    x = y = shelf_height = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: -item[1][1]):
+        if x + w > page_width:
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+        rects[key] = pygame.Rect(x, y, w, h)
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+    return rects, page_width, y + shelf_height
+
+
+def build_atlas(sprites) -> Atlas:
+    """Load, scale and pack ``sprites`` into a fresh page (slow path)."""
+    preload_images([(path, True) for path in {path for path, _size in sprites}])
+
+    images: dict[str, pygame.Surface] = {}
+    for path, size in sprites:
+        images[sprite_key(path, size)] = load_sprite(path, size)
+
+    rects, width, height = pack({key: img.get_size() for key, img in images.items()})
+    page = pygame.Surface((width, height), pygame.SRCALPHA)
+    page.blits([(images[key], rect) for key, rect in rects.items()], doreturn=False)
+    return Atlas(page, rects)
+
+
+def _source_mtimes(sprites) -> dict[str, float]:
+    return {path: os.stat(path).st_mtime for path, _size in sprites}
+
+
+def save_atlas(path: str, atlas: Atlas, sprites):
+    table = {
+        "sprites": {key: list(rect) for key, rect in atlas.rects.items()},
+        "sources": _source_mtimes(sprites),
+    }
+    table_bytes = json.dumps(table).encode("utf-8")
+    width, height = atlas.page.get_size()
+    pixels = zlib.compress(pygame.image.tobytes(atlas.page, "RGBA"), 1)
+
+    # write next to it and swap, so a half-written file is never loaded
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, ATLAS_VERSION, width, height, len(table_bytes)))
+        f.write(table_bytes)
+        f.write(pixels)
+    os.replace(tmp_path, path)
+
+
+def load_atlas(path: str, sprites) -> Atlas | None:
+    """The atlas in ``path``, or None if it is missing, broken or out of date."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < HEADER.size:
+        return None
+    magic, version, width, height, table_len = HEADER.unpack_from(data)
+    if magic != MAGIC or version != ATLAS_VERSION:
+        return None
+
+    offset = HEADER.size
+    try:
+        table = json.loads(data[offset : offset + table_len].decode("utf-8"))
+        wanted = {sprite_key(p, s) for p, s in sprites}
+        if set(table["sprites"]) != wanted:
+            return None
+        if table["sources"] != _source_mtimes(sprites):
+            return None
+        pixels = zlib.decompress(data[offset + table_len :])
+    except (ValueError, KeyError, OSError, zlib.error):
+        return None
+
+    page = pygame.image.frombytes(pixels, (width, height), "RGBA").convert_alpha()
+    rects = {key: pygame.Rect(r) for key, r in table["sprites"].items()}
+    return Atlas(page, rects)
+
+
+def load_or_build_atlas(path: str) -> Atlas:
+    sprites = atlas_sprites()
+    atlas = load_atlas(path, sprites)
+    if atlas is not None:
+        return atlas
+
+    atlas = build_atlas(sprites)
+    try:
+        save_atlas(path, atlas, sprites)
+        print("Built sprite atlas", path)
+    except OSError as exc:
+        # still use it for this run, just rebuild it next time
+        print("Could not save sprite atlas:", exc)
+    return atlas
+
+
+def rebuild_atlas_file(path: str):
+    """``--build-atlas``: (re)write the atlas file without starting the game."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    sprites = atlas_sprites()
+    atlas = build_atlas(sprites)
+    save_atlas(path, atlas, sprites)
+    width, height = atlas.page.get_size()
+    print(f"Wrote {path}: {len(atlas.rects)} sprites, {width}x{height}")
@@ -2,7 +2,8 @@ import pygame
 from dataclasses import dataclass
 
 from config import WIDTH, HEIGHT, DEFENCE_STATS
-from ui.slots import DEFENCE_ICONS
+from ui.assets import get_overlay
+from ui.slots import get_defence_icon
 
 
 @dataclass
@@ -11,6 +12,7 @@ class DefencePopupLayout:
     icon_rect: pygame.Rect
     button_rects: list[tuple[str, str, pygame.Rect]]
     stats_origin: tuple[int, int]
+    combat_origin: tuple[int, int]
 
 
 def calculate_defence_snapshot(defence) -> dict:
@@ -28,6 +30,7 @@ def calculate_defence_snapshot(defence) -> dict:
         "range": attack_range,
         "cooldown": cooldown,
         "projectile_speed": projectile_speed,
+        "attack": stats.get("attack", "projectile"),
         "crit_chance": stats["crit_chance"] * 100,
         "crit_multiplier": stats["crit_multiplier"],
         "hp": defence.hp,
@@ -38,14 +41,16 @@ def calculate_defence_snapshot(defence) -> dict:
     return snapshot
 
 
-def build_defence_popup_layout(defence) -> DefencePopupLayout:
-    popup_width = 520
-    popup_height = 260
+def build_defence_popup_layout(
+    defence, screen_size: tuple[int, int] = (WIDTH, HEIGHT)
+) -> DefencePopupLayout:
+    popup_width = 640
+    popup_height = 380
 
     popup_rect = pygame.Rect(0, 0, popup_width, popup_height)
-    popup_rect.center = (WIDTH // 2, HEIGHT // 2 - 20)
+    popup_rect.center = (screen_size[0] // 2, screen_size[1] // 2 - 20)
 
-    icon = DEFENCE_ICONS.get(defence.defence_type)
+    icon = get_defence_icon(defence.defence_type)
     if icon is None:
         icon_rect = pygame.Rect(popup_rect.left + 20, popup_rect.top + 20, 120, 120)
     else:
@@ -81,22 +86,73 @@ def build_defence_popup_layout(defence) -> DefencePopupLayout:
                 button_height,
             ),
         ),
+        (
+            "targeting",
+            f"Target: {defence.targeting.capitalize()}",
+            pygame.Rect(
+                button_x,
+                button_y + 3 * (button_height + 10),
+                button_width,
+                button_height,
+            ),
+        ),
     ]
 
-    stats_origin = (button_x, button_y + 3 * (button_height + 10) + 20)
+    stats_origin = (button_x, button_y + 4 * (button_height + 10) + 10)
+    # combat stats get their own column right of the buttons
+    combat_origin = (button_x + button_width + 30, button_y)
 
     return DefencePopupLayout(
         popup_rect=popup_rect,
         icon_rect=icon_rect,
         button_rects=button_rects,
         stats_origin=stats_origin,
+        combat_origin=combat_origin,
     )
 
 
+# rendered combat lines per defence, redone only when the numbers change
+_combat_cache: dict = {}
+
+
+def get_combat_lines(font, defence) -> list[pygame.Surface]:
+    s = defence.stats
+    key = (
+        s.shots,
+        s.hits,
+        s.crits,
+        int(s.damage),
+        s.kills,
+        int(s.overkill),
+        s.gold,
+        round(s.dps, 1),
+    )
+    cached = _combat_cache.get(defence)
+    if cached is not None and cached[0] == key and cached[1] is font:
+        return cached[2]
+
+    crit_rate = s.crits / s.shots * 100 if s.shots else 0.0
+    lines = [
+        "Combat",
+        f"Shots: {s.shots}",
+        f"Hits: {s.hits}",
+        f"Crits: {s.crits} ({crit_rate:.0f}%)",
+        f"Damage: {s.damage:.0f}",
+        f"DPS: {s.dps:.1f}",
+        f"Kills: {s.kills}",
+        f"Overkill: {s.overkill:.0f}",
+        f"Gold earned: {s.gold}",
+    ]
+    surfaces = [font.render(line, True, (230, 230, 230)) for line in lines]
+
+    # only the defences still being looked at are worth keeping
+    _combat_cache.clear()
+    _combat_cache[defence] = (key, font, surfaces)
+    return surfaces
+
+
 def draw_defence_popup(screen, font, defence, layout: DefencePopupLayout):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 140))
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen.get_size(), (0, 0, 0, 140)), (0, 0))
 
     pygame.draw.rect(screen, (28, 32, 48), layout.popup_rect, border_radius=10)
     pygame.draw.rect(screen, (0, 0, 0), layout.popup_rect, width=2, border_radius=10)
@@ -108,7 +164,7 @@ def draw_defence_popup(screen, font, defence, layout: DefencePopupLayout):
     )
     screen.blit(title_surf, title_rect)
 
-    icon = DEFENCE_ICONS.get(defence.defence_type)
+    icon = get_defence_icon(defence.defence_type)
     if icon is not None:
         screen.blit(icon, layout.icon_rect)
     else:
@@ -131,7 +187,11 @@ def draw_defence_popup(screen, font, defence, layout: DefencePopupLayout):
         f"Damage: {snapshot['damage']:.1f}",
         f"Range: {snapshot['range']:.0f}",
         f"Cooldown: {snapshot['cooldown']:.2f}s",
-        f"Projectile Speed: {snapshot['projectile_speed']:.0f}",
+        (
+            f"Projectile Speed: {snapshot['projectile_speed']:.0f}"
+            if snapshot["attack"] == "projectile"
+            else f"Attack: {snapshot['attack']} (instant)"
+        ),
         f"Crit: {snapshot['crit_chance']:.0f}% x{snapshot['crit_multiplier']:.1f}",
     ]
 
@@ -139,3 +199,7 @@ def draw_defence_popup(screen, font, defence, layout: DefencePopupLayout):
         text_surf = font.render(line, True, (230, 230, 230))
         text_rect = text_surf.get_rect(topleft=(stats_x, stats_y + i * 22))
         screen.blit(text_surf, text_rect)
+
+    combat_x, combat_y = layout.combat_origin
+    for i, text_surf in enumerate(get_combat_lines(font, defence)):
+        screen.blit(text_surf, (combat_x, combat_y + i * 22))
@@ -0,0 +1,61 @@
+# src/ui/digit_atlas.py
+import pygame
+
+# alpha is quantized so each colour only needs a handful of pre-faded glyph sets
+ALPHA_LEVELS = 16
+
+
+class DigitAtlas:
+    """
+    Pre-rendered digit glyphs for one font.
+
+    Glyphs are rendered lazily per (colour, alpha level) and reused, so
+    drawing a number is just a few blits instead of ``font.render`` +
+    ``set_alpha`` every frame.
+    """
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.height = font.get_height()
+        self.glyph_sets: dict[tuple[tuple[int, int, int], int], list] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_glyphs(self, color, alpha: int) -> list[pygame.Surface]:
+        level = min(ALPHA_LEVELS - 1, alpha * ALPHA_LEVELS // 256)
+        key = (tuple(color), level)
+
+        glyphs = self.glyph_sets.get(key)
+        if glyphs is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            level_alpha = int(255 * (level + 1) / ALPHA_LEVELS)
+            glyphs = []
+            for digit in "0123456789":
+                surf = self.font.render(digit, True, color)
+                surf.set_alpha(level_alpha)
+                glyphs.append(surf)
+            self.glyph_sets[key] = glyphs
+        return glyphs
+
+    def draw_number(
+        self,
+        surface: pygame.Surface,
+        value: int,
+        center: tuple[int, int],
+        color,
+        alpha: int = 255,
+    ):
+        glyphs = self.get_glyphs(color, alpha)
+        digits = [glyphs[ord(ch) - 48] for ch in str(max(0, value))]
+
+        total_width = 0
+        for g in digits:
+            total_width += g.get_width()
+
+        x = center[0] - total_width // 2
+        y = center[1] - self.height // 2
+        for g in digits:
+            surface.blit(g, (x, y))
+            x += g.get_width()
@@ -0,0 +1,132 @@
+# src/ui/enemy_lod.py
+import pygame
+
+from entities.enemy import HP_BAR_COLOR
+from config import (
+    LOD_CLUSTER_CELL,
+    LOD_CLUSTER_THRESHOLD,
+    LOD_FAR_FRACTION,
+    LOD_HP_BAR_THRESHOLD,
+    LOD_POINT_THRESHOLD,
+)
+
+DOT_SIZE = 6
+ENEMY_COLOR = (200, 50, 50)
+SLOWED_COLOR = (130, 90, 220)
+STUNNED_COLOR = (230, 210, 90)
+
+# small pre-rendered sprites, built on first use
+_dots: dict[tuple[int, int, int], pygame.Surface] = {}
+_cluster_markers: dict[int, pygame.Surface] = {}
+
+
+def _get_dot(color) -> pygame.Surface:
+    dot = _dots.get(color)
+    if dot is None:
+        dot = pygame.Surface((DOT_SIZE, DOT_SIZE))
+        dot.fill(color)
+        _dots[color] = dot
+    return dot
+
+
+def _get_cluster_marker(count: int) -> pygame.Surface:
+    # a handful of size buckets is enough to read "more / fewer"
+    bucket = min(4, count.bit_length() - 1)
+    marker = _cluster_markers.get(bucket)
+    if marker is None:
+        radius = 5 + bucket * 3
+        marker = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(marker, (*ENEMY_COLOR, 220), (radius, radius), radius)
+        pygame.draw.circle(marker, (0, 0, 0, 255), (radius, radius), radius, 1)
+        _cluster_markers[bucket] = marker
+    return marker
+
+
+def _dot_color(enemy):
+    if enemy.stun_timer > 0:
+        return STUNNED_COLOR
+    if enemy.slow_timer > 0:
+        return SLOWED_COLOR
+    return ENEMY_COLOR
+
+
+def hp_bar_mode(count: int, show_hp_bars: bool = True) -> str:
+    """Which enemies get an HP bar at this enemy count: "all", "damaged" or "none"."""
+    if not show_hp_bars or count > LOD_POINT_THRESHOLD:
+        return "none"
+    if count > LOD_HP_BAR_THRESHOLD:
+        return "damaged"
+    return "all"
+
+
+def draw_enemies(
+    screen: pygame.Surface,
+    enemies: list,
+    playfield_rect: pygame.Rect,
+    show_hp_bars: bool = True,
+    hp_bar_rects: list | None = None,
+) -> None:
+    """
+    Draw all enemies with a level of detail picked from how many there are.
+
+    - up to LOD_HP_BAR_THRESHOLD: full detail
+    - above it: full-health enemies skip their HP bar
+    - above LOD_POINT_THRESHOLD: enemies become dots, blitted in one call
+    - above LOD_CLUSTER_THRESHOLD: enemies in the far (top) part of the
+      field are merged into one marker per grid cell
+
+    ``hp_bar_rects`` are bars already worked out by the render prep thread;
+    when given, bodies are drawn here and the bars are just filled in.
+    """
+    count = len(enemies)
+
+    if hp_bar_rects is not None and count <= LOD_POINT_THRESHOLD:
+        for enemy in enemies:
+            enemy.draw(screen, False)
+        for rect in hp_bar_rects:
+            screen.fill(HP_BAR_COLOR, rect)
+        return
+
+    if count <= LOD_HP_BAR_THRESHOLD:
+        for enemy in enemies:
+            enemy.draw(screen, show_hp_bars)
+        return
+
+    if count <= LOD_POINT_THRESHOLD:
+        for enemy in enemies:
+            enemy.draw(screen, show_hp_bars and enemy.hp < enemy.max_hp)
+        return
+
+    half = DOT_SIZE // 2
+    blits = []
+
+    if count > LOD_CLUSTER_THRESHOLD:
+        far_y = playfield_rect.top + playfield_rect.height * LOD_FAR_FRACTION
+        cell = LOD_CLUSTER_CELL
+        clusters: dict[tuple[int, int], int] = {}
+
+        for enemy in enemies:
+            x, y = enemy.pos.x, enemy.pos.y
+            if y < far_y:
+                key = (int(x // cell), int(y // cell))
+                clusters[key] = clusters.get(key, 0) + 1
+            else:
+                blits.append((_get_dot(_dot_color(enemy)), (x - half, y - half)))
+
+        for (cx, cy), n in clusters.items():
+            marker = _get_cluster_marker(n)
+            r = marker.get_width() // 2
+            blits.append(
+                (marker, (cx * cell + cell // 2 - r, cy * cell + cell // 2 - r))
+            )
+    else:
+        for enemy in enemies:
+            blits.append(
+                (_get_dot(_dot_color(enemy)), (enemy.pos.x - half, enemy.pos.y - half))
+            )
+
+    # one C-level call for every dot / marker
+    if hasattr(screen, "fblits"):
+        screen.fblits(blits)
+    else:
+        screen.blits(blits, doreturn=False)
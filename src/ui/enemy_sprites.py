@@ -0,0 +1,123 @@
+# src/ui/enemy_sprites.py
+"""
+Pre-baked enemy sprites and their shared animation clocks.
+
+Every frame an enemy can show (direction x tint x walk frame) is built
+once by ``load_enemy_sprites`` at startup: the squash / stretch walk
+frames come out of the sprite atlas already scaled, left is a flipped
+copy of right, stunned / slowed are tinted copies. Drawing an enemy is
+then a dict lookup and one blit; nothing is scaled, flipped or rotated
+per frame.
+
+Each archetype has one ``AnimationClock`` that Game advances once per
+tick. Enemies only add their own phase to its frame, so cost per enemy
+does not depend on how many are animating.
+"""
+
+from dataclasses import dataclass
+
+import pygame
+
+from config import ENEMY_ANIM_FPS, ENEMY_SPRITE_SIZE
+from ui.assets import load_sprite, smooth_scale
+
+GOBLIN_DOWN_PATH = "assets/npc_goblin_down.png"
+GOBLIN_RIGHT_PATH = "assets/npc_goblin_right.png"
+# 1024px art drawn at ~28px: nearest-neighbour would keep 1 pixel in 36
+smooth_scale(GOBLIN_DOWN_PATH, GOBLIN_RIGHT_PATH)
+
+# walk cycle as (width, height) scale factors: squash, rest, stretch, rest
+WALK_CYCLE = ((1.08, 0.92), (1.0, 1.0), (0.93, 1.07), (1.0, 1.0))
+
+# multiplied into the sprite (BLEND_RGB_MULT) for status effects
+TINTS = {
+    "normal": None,
+    "slowed": (170, 140, 255),
+    "stunned": (255, 235, 120),
+}
+
+# archetype -> sprite per facing; there is no back view, so walking up
+# uses the front one
+ARCHETYPES = {
+    "goblin": {
+        "down": (GOBLIN_DOWN_PATH, False),
+        "up": (GOBLIN_DOWN_PATH, False),
+        "right": (GOBLIN_RIGHT_PATH, False),
+        "left": (GOBLIN_RIGHT_PATH, True),
+    },
+}
+
+
+def frame_size(scale: tuple[float, float]) -> tuple[int, int]:
+    w, h = ENEMY_SPRITE_SIZE
+    return (round(w * scale[0]), round(h * scale[1]))
+
+
+def enemy_sprites() -> list[tuple[str, tuple[int, int]]]:
+    """(path, size) of every walk frame, for the sprite atlas."""
+    paths = sorted(
+        {path for facings in ARCHETYPES.values() for path, _flip in facings.values()}
+    )
+    sizes = sorted({frame_size(scale) for scale in WALK_CYCLE})
+    return [(path, size) for path in paths for size in sizes]
+
+
+@dataclass
+class AnimationClock:
+    """Frame counter shared by every enemy of one archetype."""
+
+    frame_count: int
+    fps: float
+    time: float = 0.0
+    frame: int = 0
+
+    def advance(self, dt: float):
+        self.time = (self.time + dt) % (self.frame_count / self.fps)
+        self.frame = int(self.time * self.fps) % self.frame_count
+
+
+# (archetype, facing, tint) -> [(surface, offset from the enemy's centre)]
+_frames: dict[tuple[str, str, str], list[tuple[pygame.Surface, tuple[int, int]]]] = {}
+_clocks: dict[str, AnimationClock] = {}
+
+
+def _bake(path: str, flip: bool, tint) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+    half_h = ENEMY_SPRITE_SIZE[1] // 2
+    frames = []
+    for scale in WALK_CYCLE:
+        w, h = frame_size(scale)
+        sprite = load_sprite(path, (w, h))
+        if flip:
+            sprite = pygame.transform.flip(sprite, True, False)
+        if tint is not None:
+            sprite = sprite.copy()
+            sprite.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        # keep the feet on the same line while the body squashes / stretches
+        frames.append((sprite, (-(w // 2), half_h - h)))
+    return frames
+
+
+def load_enemy_sprites():
+    """Bake every enemy frame (call once the sprite atlas is installed)."""
+    _frames.clear()
+    for archetype, facings in ARCHETYPES.items():
+        for facing, (path, flip) in facings.items():
+            for tint_name, tint in TINTS.items():
+                _frames[(archetype, facing, tint_name)] = _bake(path, flip, tint)
+        _clocks[archetype] = AnimationClock(len(WALK_CYCLE), ENEMY_ANIM_FPS)
+
+
+def advance_animations(dt: float):
+    """Step every archetype's clock (once per tick, not per enemy)."""
+    for clock in _clocks.values():
+        clock.advance(dt)
+
+
+def get_enemy_frame(archetype: str, facing: str, tint: str, phase: int):
+    """(surface, offset) to draw, or None if the sprites aren't loaded."""
+    frames = _frames.get((archetype, facing, tint))
+    if frames is None:
+        return None
+    if tint == "stunned":
+        return frames[1]  # frozen mid-step
+    return frames[(_clocks[archetype].frame + phase) % len(frames)]
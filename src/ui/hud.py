@@ -1,7 +1,12 @@
 # src/ui/hud.py
 import pygame
 
-from config import BOTTOM_FRACTION, HEIGHT, WIDTH
+from config import BOTTOM_FRACTION
+from ui.assets import get_overlay
+from ui.digit_atlas import DigitAtlas
+
+# one digit atlas per font, built on first use
+_digit_atlases: dict[int, DigitAtlas] = {}
 
 
 def draw_background(
@@ -18,7 +23,7 @@ def draw_background(
     """
 
     # Play field = everything above the castle
-    playfield_rect = pygame.Rect(0, 0, WIDTH, castle_rect.top)
+    playfield_rect = pygame.Rect(0, 0, castle_rect.width, castle_rect.top)
     pygame.draw.rect(screen, (80, 80, 80), playfield_rect)
 
     # Castle background
@@ -58,6 +63,7 @@ def draw_castle_hp(
     castle_hp: float,
     castle_max_hp: float,
     bar_rect: pygame.Rect,
+    text_surf: pygame.Surface | None = None,
 ) -> None:
     """Draw a full-width HP bar in the bottom row."""
 
@@ -97,8 +103,9 @@ def draw_castle_hp(
     pygame.draw.rect(screen, color, fill_rect)
 
     # text centered in the row
-    hp_text = f"Castle HP {int(castle_hp)}/{int(castle_max_hp)}"
-    text_surf = font.render(hp_text, True, (255, 255, 255))
+    if text_surf is None:
+        hp_text = f"Castle HP {int(castle_hp)}/{int(castle_max_hp)}"
+        text_surf = font.render(hp_text, True, (255, 255, 255))
     text_rect = text_surf.get_rect(center=bar_rect.center)
     screen.blit(text_surf, text_rect)
 
@@ -140,21 +147,42 @@ def draw_game_overlay(
     font: pygame.font.Font,
     big_font: pygame.font.Font,
 ) -> None:
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    screen.blit(overlay, (0, 0))
+    width, height = screen.get_size()
+    screen.blit(get_overlay((width, height), (0, 0, 0, 160)), (0, 0))
 
     text_surf = big_font.render("GAME OVER", True, (255, 255, 255))
-    text_rect = text_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
+    text_rect = text_surf.get_rect(center=(width // 2, height // 2 - 30))
     screen.blit(text_surf, text_rect)
 
     small = font.render("Press ESC to quit", True, (220, 220, 220))
-    small_rect = small.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 20))
+    small_rect = small.get_rect(center=(width // 2, height // 2 + 20))
     screen.blit(small, small_rect)
 
 
+def get_digit_atlas(font: pygame.font.Font) -> DigitAtlas:
+    atlas = _digit_atlases.get(id(font))
+    if atlas is None or atlas.font is not font:
+        atlas = DigitAtlas(font)
+        _digit_atlases[id(font)] = atlas
+    return atlas
+
+
+def draw_profiler(
+    screen: pygame.Surface, font: pygame.font.Font, lines: list[str]
+) -> None:
+    """Small debug panel in the top-left corner."""
+    line_height = font.get_linesize()
+    panel = pygame.Rect(4, 4, 260, line_height * len(lines) + 8)
+    screen.blit(get_overlay(panel.size, (0, 0, 0, 170)), panel)
+
+    for i, line in enumerate(lines):
+        surf = font.render(line, True, (200, 255, 200))
+        screen.blit(surf, (panel.left + 6, panel.top + 4 + i * line_height))
+
+
 def draw_damage_numbers(
-    screen: pygame.Surface, font: pygame.font.Font, damage_numbers: list
+    screen: pygame.Surface, font: pygame.font.Font, damage_numbers
 ) -> None:
+    atlas = get_digit_atlas(font)
     for damage_number in damage_numbers:
-        damage_number.draw(screen, font)
+        damage_number.draw(screen, atlas)
@@ -0,0 +1,111 @@
+# src/ui/input_router.py
+from dataclasses import dataclass, field
+from typing import Callable
+
+import pygame
+
+HIT_CELL_SIZE = 64  # px, bucket size of the per-layer hit index
+
+
+@dataclass
+class HitLayer:
+    """
+    One clickable UI layer (action bar, shop, popup, slots...).
+
+    ``build`` returns the layer's click targets as (rect, callback) pairs
+    plus the rect of the layer's panel (or None). They are only rebuilt
+    after ``invalidate``; clicks are then answered from a small grid index.
+    """
+
+    name: str
+    priority: int
+    build: Callable[[], tuple[list[tuple[pygame.Rect, Callable]], pygame.Rect | None]]
+    is_active: Callable[[], bool]
+    modal: bool = False
+    on_outside: Callable[[], None] | None = None
+
+    dirty: bool = True
+    area: pygame.Rect | None = None
+    cells: dict[tuple[int, int], list[tuple[pygame.Rect, Callable]]] = field(
+        default_factory=dict
+    )
+
+    def rebuild(self):
+        targets, self.area = self.build()
+        self.cells = {}
+        for rect, callback in targets:
+            min_cx = rect.left // HIT_CELL_SIZE
+            max_cx = (rect.right - 1) // HIT_CELL_SIZE
+            min_cy = rect.top // HIT_CELL_SIZE
+            max_cy = (rect.bottom - 1) // HIT_CELL_SIZE
+            for cx in range(min_cx, max_cx + 1):
+                for cy in range(min_cy, max_cy + 1):
+                    self.cells.setdefault((cx, cy), []).append((rect, callback))
+        self.dirty = False
+
+    def hit(self, pos) -> Callable | None:
+        if self.dirty:
+            self.rebuild()
+        bucket = self.cells.get((pos[0] // HIT_CELL_SIZE, pos[1] // HIT_CELL_SIZE))
+        if bucket:
+            # first registered target wins, same as walking the rects in order
+            for rect, callback in bucket:
+                if rect.collidepoint(pos):
+                    return callback
+        return None
+
+
+class InputRouter:
+    """
+    Routes left clicks to UI layers in explicit priority order.
+
+    - highest priority active layer is asked first
+    - a hit calls that target's callback and stops
+    - an active *modal* layer swallows every click: clicks on its panel do
+      nothing, clicks outside call ``on_outside``
+    - if nothing handled the click, ``fallback`` is called
+    """
+
+    def __init__(self, fallback: Callable[[], None] | None = None):
+        self.layers: list[HitLayer] = []
+        self.by_name: dict[str, HitLayer] = {}
+        self.fallback = fallback
+
+    def add_layer(self, layer: HitLayer):
+        self.layers.append(layer)
+        self.layers.sort(key=lambda layer: layer.priority, reverse=True)
+        self.by_name[layer.name] = layer
+
+    def invalidate(self, name: str):
+        self.by_name[name].dirty = True
+
+    def refresh(self, name: str):
+        """Rebuild a layer now if it is dirty (e.g. before drawing from its layout)."""
+        layer = self.by_name[name]
+        if layer.dirty:
+            layer.rebuild()
+
+    def invalidate_all(self):
+        for layer in self.layers:
+            layer.dirty = True
+
+    def dispatch(self, pos) -> bool:
+        """Handle a click at ``pos``. Returns True if some layer consumed it."""
+        for layer in self.layers:
+            if not layer.is_active():
+                continue
+
+            callback = layer.hit(pos)
+            if callback is not None:
+                callback()
+                return True
+
+            if layer.modal:
+                if layer.area is None or not layer.area.collidepoint(pos):
+                    if layer.on_outside is not None:
+                        layer.on_outside()
+                return True
+
+        if self.fallback is not None:
+            self.fallback()
+        return False
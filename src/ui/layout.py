@@ -0,0 +1,85 @@
+# src/ui/layout.py
+from dataclasses import dataclass
+from typing import Callable
+
+import pygame
+
+from ui.slots import compute_slot_rects
+
+HP_BAR_HEIGHT = 44
+CASTLE_HEIGHT = 140  # tweak if you want it taller/shorter
+SPAWN_MARGIN_X = 50
+SPAWN_HEIGHT = 80
+SLOT_HIT_PADDING = 20  # clickable area is a bit larger than the visual slot
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    Screen geometry for one resolution.
+
+    Built once by ``compute_layout`` and shared by update, draw and input.
+    The rects are read-only by convention: ``.copy()`` one before moving it.
+    """
+
+    size: tuple[int, int]
+    hp_bar_rect: pygame.Rect
+    castle_rect: pygame.Rect
+    playfield_rect: pygame.Rect
+    spawn_rect: pygame.Rect
+    slot_rects: tuple[pygame.Rect, ...]
+    slot_hit_rects: tuple[pygame.Rect, ...]
+
+
+def compute_layout(size: tuple[int, int], num_slots: int) -> Layout:
+    width, height = size
+
+    # bottom-most row: full-width castle HP bar
+    hp_bar_rect = pygame.Rect(0, height - HP_BAR_HEIGHT, width, HP_BAR_HEIGHT)
+
+    # castle area sits directly above the HP bar
+    castle_rect = pygame.Rect(0, hp_bar_rect.top - CASTLE_HEIGHT, width, CASTLE_HEIGHT)
+
+    playfield_rect = pygame.Rect(0, 0, width, castle_rect.top)
+
+    spawn_rect = pygame.Rect(
+        SPAWN_MARGIN_X, 0, width - 2 * SPAWN_MARGIN_X, SPAWN_HEIGHT
+    )
+
+    slot_rects = tuple(compute_slot_rects(None, num_slots, size=size))
+    slot_hit_rects = tuple(
+        r.inflate(SLOT_HIT_PADDING, SLOT_HIT_PADDING) for r in slot_rects
+    )
+
+    return Layout(
+        size=(width, height),
+        hp_bar_rect=hp_bar_rect,
+        castle_rect=castle_rect,
+        playfield_rect=playfield_rect,
+        spawn_rect=spawn_rect,
+        slot_rects=slot_rects,
+        slot_hit_rects=slot_hit_rects,
+    )
+
+
+class LayoutModel:
+    """Holds the current Layout and tells dependants when it changes."""
+
+    def __init__(self, size: tuple[int, int], num_slots: int):
+        self.num_slots = num_slots
+        self.current = compute_layout(size, num_slots)
+        self.listeners: list[Callable[[Layout], None]] = []
+
+    def subscribe(self, callback: Callable[[Layout], None]):
+        self.listeners.append(callback)
+
+    def resize(self, size: tuple[int, int], num_slots: int | None = None):
+        """Recompute everything for a new resolution / slot count and notify."""
+        if num_slots is not None:
+            self.num_slots = num_slots
+        if size == self.current.size and len(self.current.slot_rects) == self.num_slots:
+            return
+
+        self.current = compute_layout(size, self.num_slots)
+        for callback in self.listeners:
+            callback(self.current)
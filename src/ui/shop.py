@@ -1,11 +1,15 @@
 # src/ui/shop.py
 import pygame
 
-from config import DEFENCE_STATS, HEIGHT, WIDTH
+from config import DEFENCE_STATS, DEFENCE_TYPES, HEIGHT, WIDTH
 from entities.defence import Defence
+from ui.assets import get_overlay
 
 
-def get_shop_popup_layout(owned_defences: list[tuple[str, int]]):
+def get_shop_popup_layout(
+    owned_defences: list[tuple[str, int]],
+    screen_size: tuple[int, int] = (WIDTH, HEIGHT),
+):
     """Return geometry for the shop popup:
     - popup_rect
     - shop_item_rects: dict[str, Rect]
@@ -13,9 +17,9 @@ def get_shop_popup_layout(owned_defences: list[tuple[str, int]]):
     - close_rect: Rect for the 'X' button
     """
     popup_width = 520
-    popup_height = 320
-    popup_x = (WIDTH - popup_width) // 2
-    popup_y = (HEIGHT - popup_height) // 2
+    popup_height = 360
+    popup_x = (screen_size[0] - popup_width) // 2
+    popup_y = (screen_size[1] - popup_height) // 2
     popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
 
     close_size = 24
@@ -49,8 +53,7 @@ def get_shop_popup_layout(owned_defences: list[tuple[str, int]]):
     shop_item_rects: dict[str, pygame.Rect] = {}
     item_h = 28
     item_pad = 6
-    shop_types = ["archer", "cannon", "mage"]
-    for i, dtype in enumerate(shop_types):
+    for i, dtype in enumerate(DEFENCE_TYPES):
         r = pygame.Rect(
             shop_col_rect.left,
             shop_col_rect.top + i * (item_h + item_pad),
@@ -77,17 +80,16 @@ def draw_shop_popup(
     font: pygame.font.Font,
     shop_open: bool,
     owned_defences: list[tuple[str, int]],
+    layout=None,
 ):
     if not shop_open:
         return
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen.get_size(), (0, 0, 0, 160)), (0, 0))
 
-    popup_rect, shop_rects, owned_rects, close_rect = get_shop_popup_layout(
-        owned_defences
-    )
+    if layout is None:
+        layout = get_shop_popup_layout(owned_defences, screen.get_size())
+    popup_rect, shop_rects, owned_rects, close_rect = layout
 
     pygame.draw.rect(screen, (40, 40, 70), popup_rect)
     pygame.draw.rect(screen, (0, 0, 0), popup_rect, width=2)
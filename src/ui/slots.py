@@ -1,51 +1,93 @@
 # src/ui/slots.py
-import pygame
-from config import HEIGHT, WIDTH
+import math
 import random
 
-# --- Defence icons (loaded once) ---
+import pygame
+from config import HEIGHT, WIDTH, SLOT_ROW_MAX, SLOT_GRID_MIN_SIZE
+from ui.assets import get_scaled, load_sprite
+
+# --- Defence icons (loaded on first use, not at import) ---
 ICON_SIZE = (100, 100)
-ARCHER_ICON = pygame.image.load("assets/archer_up.png")
-ARCHER_ICON = pygame.transform.scale(ARCHER_ICON, ICON_SIZE)
+SLOT_ICON_PATH = "assets/slot_spot.png"
+DEFENCE_ICON_PATHS = {
+    "archer": "assets/archer_up.png",
+    "cannon": "assets/canon_up.png",
+    "mage": "assets/mage_up.png",
+}
 
-CANNON_ICON = pygame.image.load("assets/canon_up.png")
-CANNON_ICON = pygame.transform.scale(CANNON_ICON, ICON_SIZE)
+# scaled icons by defence type ("slot" for the empty slot spot)
+_icons: dict[str, pygame.Surface] = {}
 
-MAGE_ICON = pygame.image.load("assets/mage_up.png")
-MAGE_ICON = pygame.transform.scale(MAGE_ICON, ICON_SIZE)
 
-SLOT_ICON = pygame.image.load("assets/slot_spot.png")
-SLOT_ICON = pygame.transform.scale(SLOT_ICON, ICON_SIZE)
+def _get_icon(name: str, path: str) -> pygame.Surface:
+    icon = _icons.get(name)
+    if icon is None:
+        icon = load_sprite(path, ICON_SIZE)
+        _icons[name] = icon
+    return icon
 
 
-DEFENCE_ICONS = {
-    "archer": ARCHER_ICON,
-    "cannon": CANNON_ICON,
-    "mage": MAGE_ICON,
-}
+def get_defence_icon(defence_type: str) -> pygame.Surface | None:
+    """Icon for a defence type, or None if it has none (drawn as a box)."""
+    path = DEFENCE_ICON_PATHS.get(defence_type)
+    if path is None:
+        return None
+    return _get_icon(defence_type, path)
+
+
+def get_slot_icon() -> pygame.Surface:
+    return _get_icon("slot", SLOT_ICON_PATH)
+
 
+# slot labels / level texts repeat every frame, render each once
+_text_cache: dict[tuple, pygame.Surface] = {}
 
-def compute_slot_rects(screen: pygame.Surface, num_slots: int) -> list[pygame.Rect]:
+
+def _render_text(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+    return surf
+
+
+def compute_slot_rects(
+    screen: pygame.Surface | None,
+    num_slots: int,
+    size: tuple[int, int] | None = None,
+) -> list[pygame.Rect]:
     """
     Compute a horizontal row of slot rects, centered on X,
     but placed higher up on the screen (above the castle area).
     These rects are used both for drawing and clicking.
-    """
-    slot_width, slot_height = ICON_SIZE  # ⬅️ match the visual icon size
-    gap = WIDTH / 7  # can tweak if icons get too close
 
-    total_width = num_slots * slot_width + (num_slots - 1) * gap
-    start_x = (WIDTH - total_width) // 2
+    More than ``SLOT_ROW_MAX`` slots become a grid growing upwards from that
+    row, with the slots shrunk until the grid fits the lower half of the
+    field.
+
+    Prefer ``Game.layout.slot_rects``, which caches this per resolution.
+    """
+    width, height = size if size is not None else (WIDTH, HEIGHT)
 
     hp_bar_height = 24
     ui_row_height = 40
     castle_height = 120
 
-    castle_top = HEIGHT - (hp_bar_height + ui_row_height + castle_height)
+    castle_top = height - (hp_bar_height + ui_row_height + castle_height)
 
     # place slots ABOVE the castle, with some margin
     row_y = castle_top - 80
 
+    if num_slots > SLOT_ROW_MAX:
+        return _grid_slot_rects(num_slots, width, row_y + ICON_SIZE[1])
+
+    slot_width, slot_height = ICON_SIZE  # ⬅️ match the visual icon size
+    gap = width / 7  # can tweak if icons get too close
+
+    total_width = num_slots * slot_width + (num_slots - 1) * gap
+    start_x = (width - total_width) // 2
+
     rects: list[pygame.Rect] = []
     x = start_x
     for _ in range(num_slots):
@@ -55,6 +97,32 @@ def compute_slot_rects(screen: pygame.Surface, num_slots: int) -> list[pygame.Re
     return rects
 
 
+def _grid_slot_rects(num_slots: int, width: int, bottom: int) -> list[pygame.Rect]:
+    """Rows of square slots, bottom row first, filling up to half the field."""
+    margin = 40
+    area_width = width - 2 * margin
+    area_height = bottom // 2
+
+    # biggest slot size whose grid still fits (cells are 1.5x the slot)
+    slot = ICON_SIZE[0]
+    while True:
+        cell = int(slot * 1.5)
+        cols = max(1, min(num_slots, area_width // cell))
+        rows = math.ceil(num_slots / cols)
+        if rows * cell <= area_height or slot <= SLOT_GRID_MIN_SIZE:
+            break
+        slot -= 4
+
+    start_x = margin + (area_width - cols * cell) // 2 + (cell - slot) // 2
+    rects: list[pygame.Rect] = []
+    for i in range(num_slots):
+        row, col = divmod(i, cols)
+        x = start_x + col * cell
+        y = bottom - (row + 1) * cell + (cell - slot) // 2
+        rects.append(pygame.Rect(x, y, slot, slot))
+    return rects
+
+
 def get_slot_index_at_pos(
     slot_rects: list[pygame.Rect], pos: tuple[int, int]
 ) -> int | None:
@@ -74,27 +142,31 @@ def draw_slots(
     slot_defences: list,
     selected_slot: int | None,
     slot_rects: list[pygame.Rect],
+    shake: bool = True,
 ):
     """Draw the HUD slots, defence icons and levels."""
     for i, (label, rect) in enumerate(zip(labels, slot_rects)):
         defence = slot_defences[i]
+        full_size = rect.height >= ICON_SIZE[1]
 
-        if slot_defences[i] is None:
+        if defence is None and full_size:
 
-            # Slot label
-            label_surf = font.render(label, True, (220, 220, 220))
+            # Slot label (grid slots are too small for one)
+            label_surf = _render_text(font, label, (220, 220, 220))
             label_rect = label_surf.get_rect(midleft=(rect.left + 25, rect.top + 35))
             screen.blit(label_surf, label_rect)
 
         if defence is not None:
             # try to get a sprite for this defence type
-            icon_surf = DEFENCE_ICONS.get(defence.defence_type)
+            icon_surf = get_defence_icon(defence.defence_type)
+            if icon_surf is not None and not full_size:
+                icon_surf = get_scaled(icon_surf, rect.size)
 
             # base icon center
             cx, cy = rect.center
 
             # small jitter if this defence recently fired
-            if getattr(defence, "shake_time", 0) > 0:
+            if shake and getattr(defence, "shake_time", 0) > 0:
                 jx = random.randint(-defence.shake_magnitude, defence.shake_magnitude)
                 jy = random.randint(-defence.shake_magnitude, defence.shake_magnitude)
             else:
@@ -112,9 +184,14 @@ def draw_slots(
                 )
                 pygame.draw.rect(screen, (0, 0, 0), icon_rect, width=1, border_radius=6)
 
-            # level text above the defence icon
-            level_text = font.render(f"Lv{defence.level}", True, (255, 255, 255))
-            lvl_rect = level_text.get_rect(midbottom=(rect.centerx, rect.bottom - 110))
+            # level text above the defence icon (inside it for grid slots)
+            level_text = _render_text(font, f"Lv{defence.level}", (255, 255, 255))
+            if full_size:
+                lvl_rect = level_text.get_rect(
+                    midbottom=(rect.centerx, rect.bottom - 110)
+                )
+            else:
+                lvl_rect = level_text.get_rect(midbottom=rect.midbottom)
             screen.blit(level_text, lvl_rect)
 
 
@@ -166,6 +243,16 @@ def draw_slot_spots(screen: pygame.Surface, slot_rects: list[pygame.Rect]):
     """Draw only the slot background (slot spot image) for each slot."""
     ox = 0
     oy = 35
+    slot_icon = get_slot_icon()
+    batch = []
     for rect in slot_rects:
-        spot_rect = SLOT_ICON.get_rect(center=(rect.centerx + ox, rect.centery + oy))
-        screen.blit(SLOT_ICON, spot_rect)
+        if rect.height >= ICON_SIZE[1]:
+            spot = slot_icon
+            dy = oy
+        else:
+            spot = get_scaled(slot_icon, rect.size)
+            dy = oy * rect.height // ICON_SIZE[1]
+        spot_rect = spot.get_rect(center=(rect.centerx + ox, rect.centery + dy))
+        batch.append((spot, spot_rect))
+    # one call for the whole grid
+    screen.blits(batch, doreturn=False)